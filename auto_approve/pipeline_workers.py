@@ -12,6 +12,7 @@
 from __future__ import annotations
 from typing import Optional, Tuple, Dict, Any, List
 import time
+import uuid
 import numpy as np
 
 from PySide6 import QtCore
@@ -161,8 +162,8 @@ class VisionWorker(QtCore.QObject):
         self._timer: Optional[QtCore.QTimer] = None
         self._running = False
 
-        # 模板缓存（与进程池任务参数共享）
-        self._templates: List[Tuple[np.ndarray, Tuple[int, int]]] = []
+        # 模板键：(模板路径, 加载批次)，进程池子进程据此加载并缓存模板，任务参数不携带模板图像
+        self._templates_key: Optional[Tuple[Tuple[str, ...], str]] = None
 
     @QtCore.Slot()
     def start(self):
@@ -205,9 +206,9 @@ class VisionWorker(QtCore.QObject):
             return
 
         # 延迟加载模板
-        if not self._templates:
+        if self._templates_key is None:
             self._ensure_templates_loaded()
-            if not self._templates:
+            if self._templates_key is None:
                 return
 
         # 裁剪ROI
@@ -216,7 +217,7 @@ class VisionWorker(QtCore.QObject):
         # 组装匹配参数，提交CPU任务（进程池，避免GIL阻塞）
         params = {
             'roi_img': roi_img,
-            'templates': self._templates,
+            'templates_key': self._templates_key,
             'threshold': float(getattr(self._cfg, 'threshold', 0.88)),
             'grayscale': bool(getattr(self._cfg, 'grayscale', True)),
             'roi_offset': (roi_left, roi_top),
@@ -246,9 +247,10 @@ class VisionWorker(QtCore.QObject):
             if not paths:
                 self.sig_log.emit("模板路径为空")
                 return
-            tm.load_templates(paths)
-            self._templates = tm.get_templates(paths)
-            self.sig_log.emit(f"已加载模板{len(self._templates)}个")
+            count = tm.load_templates(paths)
+            # 每次重新加载都生成新的模板键，子进程据此丢弃旧模板
+            self._templates_key = (tuple(paths), uuid.uuid4().hex) if count else None
+            self.sig_log.emit(f"已加载模板{count}个")
         except Exception as e:
             self.sig_log.emit(f"加载模板失败: {e}")
 
@@ -24,6 +24,9 @@ from auto_approve.win_clicker import post_click_screen_pos
 from auto_approve.performance_optimizer import PerformanceOptimizer
 from capture.capture_manager import CaptureManager
 from utils.win_dpi import set_process_dpi_awareness, get_dpi_info_summary
+from utils.template_pyramid import (
+    PYRAMID_MIN_SIDE, CoarseTemplate, build_coarse_template, coarse_to_fine_match
+)
 
 # 导入多线程任务模块
 from workers.cpu_tasks import submit_cpu, get_global_cpu_manager
@@ -53,8 +56,9 @@ class RefactoredScannerWorker(QtCore.QThread):
         self._scan_count = 0
         self._total_scan_time = 0.0
         
-        # 模板缓存（在主线程加载，传递给子进程）
-        self._templates: List[Tuple[np.ndarray, Tuple[int, int]]] = []
+        # 模板键（在IO线程校验模板后生成，随任务传给子进程）
+        # 子进程按模板键缓存整理好的模板，任务参数中不再携带模板图像
+        self._templates_key: Optional[Tuple[Tuple[str, ...], str]] = None
         self._template_paths: List[str] = []
         
         # 捕获管理器
@@ -125,8 +129,7 @@ class RefactoredScannerWorker(QtCore.QThread):
     def _load_templates_async(self):
         """异步加载模板"""
         def load_templates_task():
-            """IO任务：加载模板文件"""
-            templates = []
+            """IO任务：校验模板文件"""
             template_paths = []
             
             try:
@@ -135,20 +138,17 @@ class RefactoredScannerWorker(QtCore.QThread):
                         self._logger.warning(f"模板文件不存在: {template_path}")
                         continue
                     
-                    # 加载模板图像
+                    # 确认模板图像可以解码（匹配时由子进程自行加载）
                     template = cv2.imread(template_path, cv2.IMREAD_COLOR)
                     if template is None:
                         self._logger.warning(f"无法加载模板: {template_path}")
                         continue
                     
-                    h, w = template.shape[:2]
-                    templates.append((template, (w, h)))
                     template_paths.append(template_path)
                 
                 return {
-                    'templates': templates,
                     'template_paths': template_paths,
-                    'count': len(templates)
+                    'count': len(template_paths)
                 }
             except Exception as e:
                 return {'error': str(e)}
@@ -159,8 +159,9 @@ class RefactoredScannerWorker(QtCore.QThread):
                 self._logger.error(f"模板加载失败: {result['error']}")
                 return
             
-            self._templates = result['templates']
             self._template_paths = result['template_paths']
+            # 每次重新加载都生成新的模板键，子进程据此丢弃旧模板
+            self._templates_key = (tuple(self._template_paths), uuid.uuid4().hex)
             self._logger.info(f"已加载 {result['count']} 个模板")
         
         def on_templates_error(task_id: str, error_msg: str, exception):
@@ -265,7 +266,7 @@ class RefactoredScannerWorker(QtCore.QThread):
     def _scan_and_maybe_click_async(self):
         """异步扫描和点击"""
         # 检查模板是否就绪
-        if not self._templates:
+        if not self._template_paths:
             return
         
         if not self._capture_manager:
@@ -291,7 +292,7 @@ class RefactoredScannerWorker(QtCore.QThread):
         # 准备任务参数
         match_params = {
             'roi_img': roi_img,
-            'templates': self._templates,
+            'templates_key': self._templates_key,
             'threshold': self.cfg.threshold,
             'grayscale': self.cfg.grayscale,
             'roi_offset': (roi_left, roi_top),
@@ -527,9 +528,47 @@ class RefactoredScannerWorker(QtCore.QThread):
             )
 
 
+def prepare_match_template(template: np.ndarray, grayscale: bool
+                           ) -> Tuple[np.ndarray, Tuple[int, int], Optional[CoarseTemplate]]:
+    """整理单个模板：(匹配用模板, (w, h), 粗模板或 None)
+
+    只保留 grayscale 设置实际使用的版本：灰度模式为灰度模板及其粗模板，
+    彩色模式为 BGR 模板（彩色匹配不走粗层）。
+    """
+    h, w = template.shape[:2]
+    if not grayscale:
+        return template, (w, h), None
+    gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY) if template.ndim == 3 else template
+    return gray, (w, h), build_coarse_template(gray)
+
+
+# 工作进程内的模板缓存：(模板键, grayscale) -> [prepare_match_template 的结果, ...]
+# 模板键为 (模板路径, 加载批次)，每个工作进程遇到新键时从磁盘加载一次
+_worker_templates: Dict[tuple, list] = {}
+# 同时保留的模板键数量上限（扫描线程与识别线程可能同时使用进程池）
+_WORKER_TEMPLATES_LIMIT = 4
+
+
+def _get_worker_templates(templates_key: Tuple[Tuple[str, ...], str], grayscale: bool) -> list:
+    """取得（必要时加载并缓存）当前工作进程中与模板键对应的匹配模板"""
+    key = (templates_key, grayscale)
+    templates = _worker_templates.get(key)
+    if templates is None:
+        from utils.memory_template_manager import get_template_manager
+        paths = list(templates_key[0])
+        tm = get_template_manager()
+        tm.load_templates(paths)
+        templates = [prepare_match_template(tpl, grayscale) for tpl, _ in tm.get_templates(paths)]
+        if len(_worker_templates) >= _WORKER_TEMPLATES_LIMIT:
+            _worker_templates.clear()
+        _worker_templates[key] = templates
+    return templates
+
+
 # ==================== CPU密集型任务函数 ====================
 # 注意：这些函数将在独立进程中执行
 
+
 def template_matching_task(params: Dict[str, Any]) -> Dict[str, Any]:
     """模板匹配任务（CPU密集型）
 
@@ -543,9 +582,9 @@ def template_matching_task(params: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         roi_img = params['roi_img']
-        templates = params['templates']
         threshold = params['threshold']
         grayscale = params['grayscale']
+        templates = _get_worker_templates(params['templates_key'], grayscale)
         roi_offset = params['roi_offset']
         click_offset = params['click_offset']
         task_id = params['task_id']
@@ -554,17 +593,25 @@ def template_matching_task(params: Dict[str, Any]) -> Dict[str, Any]:
         best_loc = None
         best_template_size = None
 
+        # ROI 只转换一次灰度；模板已按 grayscale 设置整理好
+        if grayscale and len(roi_img.shape) == 3:
+            roi_img = cv2.cvtColor(roi_img, cv2.COLOR_BGR2GRAY)
+
+        # 灰度匹配且 ROI 足够大时生成一次 1/2 金字塔层，供有粗模板的模板做由粗到精匹配
+        rh, rw = roi_img.shape[:2]
+        roi_half = None
+        if grayscale and min(rh, rw) >= 2 * PYRAMID_MIN_SIDE:
+            roi_half = cv2.pyrDown(roi_img)
+
         # 遍历所有模板进行匹配
-        for tpl, (tw, th) in templates:
-            if grayscale:
-                # 转换为灰度图
-                gray_roi = cv2.cvtColor(roi_img, cv2.COLOR_BGR2GRAY) if len(roi_img.shape) == 3 else roi_img
-                gray_tpl = cv2.cvtColor(tpl, cv2.COLOR_BGR2GRAY) if len(tpl.shape) == 3 else tpl
-                result = cv2.matchTemplate(gray_roi, gray_tpl, cv2.TM_CCOEFF_NORMED)
+        for tpl, (tw, th), coarse in templates:
+            if tw > rw or th > rh:
+                continue
+            if roi_half is not None and coarse is not None:
+                max_val, max_loc = coarse_to_fine_match(roi_img, roi_half, tpl, coarse, threshold)
             else:
                 result = cv2.matchTemplate(roi_img, tpl, cv2.TM_CCOEFF_NORMED)
-
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
 
             if max_val > best_score:
                 best_score = max_val
@@ -55,6 +55,7 @@ class CaptureManager:
         self._target_fps = 30
         self._include_cursor = False
         self._border_required = False
+        self._output_roi: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None
 
         if not WGC_AVAILABLE:
             self._logger.error("Windows Graphics Capture 不可用")
@@ -103,6 +104,7 @@ class CaptureManager:
 
             # 创建新会话
             self._session = WGCCaptureSession.from_hwnd(hwnd)
+            self._session.set_output_roi(self._output_roi)
             self._target_hwnd = hwnd
 
             # 检查超时
@@ -193,6 +195,7 @@ class CaptureManager:
 
             # 创建新会话
             self._session = WGCCaptureSession.from_monitor(hmonitor)
+            self._session.set_output_roi(self._output_roi)
             self._target_hmonitor = hmonitor
 
             # 启动捕获
@@ -313,7 +316,8 @@ class CaptureManager:
         return self._global_cache_manager.get_statistics()
 
     def configure(self, fps: int = 30, include_cursor: bool = False,
-                  border_required: bool = False, restore_minimized: bool = True):
+                  border_required: bool = False, restore_minimized: bool = True,
+                  output_roi: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None):
         """
         配置捕获参数
 
@@ -322,11 +326,14 @@ class CaptureManager:
             include_cursor: 是否包含鼠标光标
             border_required: 是否需要窗口边框
             restore_minimized: 是否自动恢复最小化窗口
+            output_roi: 输出裁剪区域 (left, top, right, bottom)，right/bottom 为 None 表示
+                延伸到帧边缘；设置后帧（含共享缓存）只包含该区域，None 表示整帧
         """
         self._target_fps = max(1, min(fps, 60))
         self._include_cursor = include_cursor
         self._border_required = border_required
         self._restore_minimized = restore_minimized
+        self._output_roi = output_roi
 
         # 如果会话已启动，需要重启以应用新配置
         if self._session:
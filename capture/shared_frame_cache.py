@@ -48,13 +48,15 @@ class SharedFrameCache:
         self._cache_misses = 0
         self._total_captures = 0
         
-    def cache_frame(self, frame: np.ndarray, frame_id: str = None) -> str:
+    def cache_frame(self, frame: np.ndarray, frame_id: str = None, copy: bool = True) -> str:
         """
         缓存一帧图像
         
         Args:
             frame: BGR图像数据
             frame_id: 帧ID，如果为None则自动生成
+            copy: 是否拷贝帧数据；调用方移交所有权（之后不再修改该数组）时传 False，
+                  省去一次整帧拷贝
             
         Returns:
             str: 帧ID
@@ -67,7 +69,9 @@ class SharedFrameCache:
             self._cleanup_old_cache()
             
             # 缓存新帧
-            self._cached_frame = frame.copy() if frame is not None else None
+            if frame is not None and copy:
+                frame = frame.copy()
+            self._cached_frame = frame
             self._frame_timestamp = time.time()
             self._frame_id = frame_id
             self._reference_count = 0
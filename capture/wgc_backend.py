@@ -68,6 +68,8 @@ class WGCCaptureSession:
         self._frame_interval = 1.0 / 30
         self._include_cursor = False  # 默认禁用光标
         self._border_required = False  # 默认禁用边框
+        # 输出裁剪区域 (left, top, right|None, bottom|None)，None 表示输出整帧
+        self._output_roi: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None
 
         # 帧缓冲和同步
         self._lock = threading.Lock()
@@ -119,6 +121,35 @@ class WGCCaptureSession:
         session._target_hmonitor = hmonitor
         return session
         
+    def set_output_roi(self, roi: Optional[Tuple[int, int, Optional[int], Optional[int]]]) -> None:
+        """设置输出裁剪区域
+
+        设置后每帧只转换/缓存该区域（BGR uint8），扫描等只关心局部区域的使用者
+        不必再搬运整帧；ContentSize 仍记录整帧尺寸，坐标换算不受影响。
+
+        Args:
+            roi: (left, top, right, bottom)，right/bottom 为 None 表示延伸到帧边缘；None 表示整帧
+        """
+        self._output_roi = roi
+
+    def _crop_to_output_roi(self, image: np.ndarray) -> np.ndarray:
+        """记录整帧 ContentSize 并按输出区域裁剪（返回视图）"""
+        h, w = image.shape[:2]
+        self._last_content_size = (w, h)
+        if self._output_roi is None:
+            return image
+
+        left, top, right, bottom = self._output_roi
+        if right is None:
+            right = w
+        if bottom is None:
+            bottom = h
+        left = max(0, min(left, w))
+        top = max(0, min(top, h))
+        right = max(left, min(right, w))
+        bottom = max(top, min(bottom, h))
+        return image[top:bottom, left:right]
+
     def start(self, target_fps: int = 30, include_cursor: bool = False,
               border_required: bool = False, dirty_region_mode: Optional[str] = None) -> bool:
         """
@@ -413,7 +444,7 @@ class WGCCaptureSession:
         1. 获取 ContentSize，检查是否需要重建 FramePool
         2. 逐行拷贝处理 RowPitch，避免畸变
         3. 按 ContentSize 裁剪，避免未定义区域
-        4. BGRA→BGR 转换（OpenCV格式）
+        4. 按输出区域裁剪后做 BGRA→BGR 转换（OpenCV格式），ContentSize 记录整帧尺寸
 
         Args:
             frame: Frame对象，包含图像数据和ContentSize
@@ -432,16 +463,10 @@ class WGCCaptureSession:
             # 从Frame对象提取BGR图像 - 严格按WGC最佳实践
             bgr_image = self._extract_bgr_from_frame_strict(frame)
             if bgr_image is not None:
-                # 记录ContentSize用于坐标缩放（宽、高）
-                try:
-                    h, w = bgr_image.shape[:2]
-                    self._last_content_size = (w, h)
-                except Exception:
-                    pass
-
-                # 缓存到共享帧缓存系统
+                # 缓存到共享帧缓存系统：bgr_image 是本次提取新生成的数组，之后不再修改
+                # （grab 返回的是拷贝），直接移交给缓存，避免每帧再整帧拷贝一次
                 frame_id = f"{self._session_id}_{self._frame_count}"
-                self._frame_cache.cache_frame(bgr_image, frame_id)
+                self._frame_cache.cache_frame(bgr_image, frame_id, copy=False)
 
                 with self._lock:
                     self._latest_frame = bgr_image
@@ -501,14 +526,14 @@ class WGCCaptureSession:
                                     # 已经是HxWx3的BGR格式
                                     if buffer.shape[0] == height and buffer.shape[1] == width:
                                         self._logger.debug(f"成功从convert_to_bgr()提取BGR图像: {buffer.shape}")
-                                        return buffer.copy()
+                                        return self._crop_to_output_roi(buffer).copy()
                                     else:
                                         self._logger.warning(f"BGR buffer尺寸不匹配: {buffer.shape} vs {height}x{width}")
                                 elif len(buffer.shape) == 3 and buffer.shape[2] == 4:
-                                    # 仍然是BGRA格式，需要转换
-                                    bgr_array = buffer[:, :, :3]  # 取前3个通道
+                                    # 仍然是BGRA格式，需要转换（cvtColor 一趟完成去 alpha 与连续化拷贝）
+                                    bgr_array = cv2.cvtColor(self._crop_to_output_roi(buffer), cv2.COLOR_BGRA2BGR)
                                     self._logger.debug(f"从BGRA转换为BGR: {bgr_array.shape}")
-                                    return bgr_array.copy()
+                                    return bgr_array
                                 else:
                                     self._logger.warning(f"BGR Frame buffer格式异常: {buffer.shape}")
                             else:
@@ -551,7 +576,7 @@ class WGCCaptureSession:
 
                         if img_bgr is not None:
                             self._logger.debug(f"成功从save_as_image()提取图像: {img_bgr.shape}")
-                            return img_bgr
+                            return np.ascontiguousarray(self._crop_to_output_roi(img_bgr))
                         else:
                             self._logger.warning("OpenCV无法读取保存的图像文件")
                     else:
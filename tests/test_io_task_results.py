@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+IO任务结果隔离的测试
+
+配置读取缓存命中时、以及多个调用方合并到同一个在途任务时，各调用方拿到的结果
+不能互相共享，否则一处原地修改会污染缓存或其他调用方的数据。
+"""
+
+import json
+
+from workers.io_tasks import ConfigurationTask, FileReadTask, _Dispatcher
+
+
+def test_cached_config_read_returns_independent_data(tmp_path):
+    """修改一次读取结果不影响之后命中缓存的读取。"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"rois": [{"x": 1}], "threshold": 0.8}), encoding="utf-8")
+
+    first = ConfigurationTask(str(config_path)).execute()
+    first['config_data']['rois'][0]['x'] = 99
+    first['config_data']['threshold'] = 0.1
+
+    second = ConfigurationTask(str(config_path)).execute()
+    assert second['cached']
+    assert second['config_data'] == {"rois": [{"x": 1}], "threshold": 0.8}
+    assert second['config_data'] is not first['config_data']
+
+
+def test_coalesced_file_reads_get_independent_results(tmp_path):
+    """合并的在途读取中，一个回调修改结果不影响其他回调收到的内容。"""
+    file_path = tmp_path / "data.json"
+    file_path.write_text(json.dumps({"items": [1, 2]}), encoding="utf-8")
+    dispatcher = _Dispatcher()
+    received = []
+
+    def on_success(task_id, result):
+        received.append(result)
+        result['content']['items'].append(3)
+
+    first, second = FileReadTask(str(file_path)), FileReadTask(str(file_path))
+    assert dispatcher.register(first, on_success) is False
+    assert dispatcher.register(second, on_success) is True
+    dispatcher._on_ok(first._dispatch_key, first.execute())
+
+    assert len(received) == 2
+    assert received[1] is not received[0]
+    assert received[1]['content'] == {"items": [1, 2, 3]}
+    assert received[0]['content'] == {"items": [1, 2, 3]}
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+日志分析任务的模式匹配测试
+
+LogAnalysisTask 对ASCII模式先在字节上（忽略大小写）预筛选；字节正则的字符类只认ASCII，
+这里确保含中文的日志行不会因此被漏掉，结果与逐行字符串匹配一致。
+"""
+
+import re
+
+from workers.io_tasks import LogAnalysisTask
+
+
+LOG_TEXT = "中文 内容\nabc error\n错误:超时\n[WARN] 重试 3 次\n"
+
+
+def _matched_line_numbers(tmp_path, pattern):
+    log_path = tmp_path / "app.log"
+    log_path.write_text(LOG_TEXT, encoding="utf-8")
+    result = LogAnalysisTask(str(log_path), pattern).execute()
+    return [item['line_number'] for item in result['matched_lines']]
+
+
+def _expected_line_numbers(pattern):
+    regex = re.compile(pattern)
+    return [num for num, line in enumerate(LOG_TEXT.split('\n'), 1) if regex.search(line.strip())]
+
+
+def test_unicode_character_classes_match_non_ascii_lines(tmp_path):
+    """\\w、\\s、\\b 等字符类与单个 "." 在中文行上的命中与字符串匹配一致。"""
+    for pattern in (r'\w+', r'\S\s\S', r'\b重试\b', r'误.超', r'[^a-z]{2}'):
+        assert _matched_line_numbers(tmp_path, pattern) == _expected_line_numbers(pattern), pattern
+
+
+def test_plain_ascii_patterns_still_use_byte_prefilter_results(tmp_path):
+    """普通ASCII模式（含 ".*"）的结果不变。"""
+    for pattern in ('error', 'WARN', r'a.*r'):
+        assert _matched_line_numbers(tmp_path, pattern) == _expected_line_numbers(pattern), pattern
+
+
+def test_pattern_match_is_case_sensitive(tmp_path):
+    """字节预筛选忽略大小写，但命中行仍按区分大小写的原始模式确认。"""
+    assert _matched_line_numbers(tmp_path, 'ERROR') == []
+    assert _matched_line_numbers(tmp_path, 'warn') == []
+    assert _matched_line_numbers(tmp_path, 'WARN') == [4]
+
+
+def test_max_lines_stops_newline_scan_across_chunks(tmp_path, monkeypatch):
+    """换行分块查找在跨块时仍按max_lines截断，统计只覆盖截断前的行。"""
+    monkeypatch.setattr(LogAnalysisTask, '_SCAN_CHUNK_SIZE', 16)
+    log_path = tmp_path / "big.log"
+    log_path.write_text("ok line\n" * 5 + "error here\n" * 20, encoding="utf-8")
+    result = LogAnalysisTask(str(log_path), 'error', max_lines=8).execute()
+    assert result['total_lines'] == 8
+    assert result['error_count'] == 3
+    assert [item['line_number'] for item in result['matched_lines']] == [6, 7, 8]
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+扫描进程配置差异计算的单元测试
+
+该测试仅验证纯逻辑函数 `_config_changes` 的行为，不启动真实进程，
+用于确保 update_config 只发送变化字段，且合并后与完整配置一致。
+"""
+
+import copy
+from dataclasses import replace
+
+from auto_approve.config_manager import AppConfig
+from workers.scanner_process import _config_changes
+
+
+def test_unchanged_config_has_no_changes():
+    """配置未变化时差异为空。"""
+    cfg = AppConfig()
+    assert _config_changes(cfg, copy.deepcopy(cfg)) == {}
+
+
+def test_changed_fields_merge_back_to_new_config():
+    """差异只包含变化字段，合并到旧配置后与新配置相等。"""
+    old = AppConfig()
+    new = copy.deepcopy(old)
+    new.interval_ms = old.interval_ms + 100
+    new.threshold = 0.5
+    changes = _config_changes(old, new)
+    assert set(changes) == {'interval_ms', 'threshold'}
+    assert replace(old, **changes) == new
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+扫描进程ROI预解析的单元测试
+
+该测试仅验证纯逻辑函数 `_resolve_roi` 的行为，不依赖真实的WGC或Windows API，
+用于确保各种ROI配置格式在配置变化时被解析为统一的 (left, top, right, bottom)。
+"""
+
+from auto_approve.config_manager import ROI
+from workers.scanner_process import _resolve_roi
+
+
+def test_dataclass_roi_with_size():
+    """dataclass ROI 提供宽高时，右下角为左上角加宽高。"""
+    assert _resolve_roi(ROI(x=10, y=20, w=50, h=30)) == (10, 20, 60, 50)
+
+
+def test_dataclass_roi_without_size_extends_to_edge():
+    """dataclass ROI 宽高为 0 时，右下角延伸到图像边缘（None）。"""
+    assert _resolve_roi(ROI(x=10, y=20, w=0, h=0)) == (10, 20, None, None)
+
+
+def test_dict_and_sequence_roi():
+    """dict 缺省右下角表示图像边缘；序列按 [left, top, right, bottom] 解析。"""
+    assert _resolve_roi({'left': 5, 'top': 3}) == (5, 3, None, None)
+    assert _resolve_roi([1, 2, 3, 4]) == (1, 2, 3, 4)
+
+
+def test_unknown_or_invalid_roi_uses_full_image():
+    """无ROI、未知格式或解析失败时返回 None，表示使用全图。"""
+    assert _resolve_roi(None) is None
+    assert _resolve_roi('abc') is None
+    assert _resolve_roi([1, 2, 3]) is None
+    assert _resolve_roi({'right': 'x'}) is None
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+扫描进程状态与命中结果二进制编码的单元测试
+
+该测试仅验证纯逻辑函数 `_encode_status`/`_decode_status` 与 `_encode_hit`/`_decode_hit` 的往返一致性，
+不依赖真实的进程或管道，用于确保状态与命中结果经 Pipe 字节传输后字段完整、中文不乱码。
+"""
+
+from workers.scanner_process import (
+    ScannerHit, ScannerStatus, _decode_hit, _decode_status, _encode_hit, _encode_status,
+)
+
+
+def test_status_round_trip():
+    """完整字段（含中文）编码后再解码应与原状态一致。"""
+    status = ScannerStatus(
+        running=True,
+        status_text="运行中",
+        backend="WGC 窗口捕获",
+        detail="上次匹配: 0.912",
+        scan_count=12345,
+        error_message="",
+        timestamp=1700000000.25,
+    )
+    assert _decode_status(_encode_status(status)) == status
+
+
+def test_default_status_round_trip():
+    """默认（全空）状态同样可以往返。"""
+    status = ScannerStatus()
+    assert _decode_status(_encode_status(status)) == status
+
+
+def test_hit_round_trip():
+    """命中结果编码后再解码应与原结果一致（坐标可为负，多显示器场景）。"""
+    hit = ScannerHit(score=0.93, x=-1280, y=540, timestamp=1700000000.5)
+    assert _decode_hit(_encode_hit(hit)) == hit
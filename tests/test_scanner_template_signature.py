@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+扫描进程模板签名的单元测试
+
+仅验证纯函数 `_templates_signature`：配置更新时据此判断模板是否需要重新加载。
+"""
+
+import os
+
+from workers.scanner_process import _templates_signature
+
+
+def test_signature_stable_until_file_changes(tmp_path):
+    """文件未改动时签名不变；内容或修改时间变化后签名随之变化。"""
+    path = tmp_path / "approve.png"
+    path.write_bytes(b"\x89PNG-a")
+    first = _templates_signature([str(path)])
+    assert _templates_signature([str(path)]) == first
+
+    path.write_bytes(b"\x89PNG-bb")
+    os.utime(path, ns=(0, first[0][1] + 1_000_000_000))
+    assert _templates_signature([str(path)]) != first
+
+
+def test_signature_marks_missing_files_and_keeps_order(tmp_path):
+    """缺失文件记为 -1；路径顺序变化也视为模板列表变化。"""
+    a = tmp_path / "a.png"
+    a.write_bytes(b"a")
+    missing = str(tmp_path / "missing.png")
+    signature = _templates_signature([str(a), missing])
+    assert signature[1] == (missing, -1, -1)
+    assert _templates_signature([missing, str(a)]) != signature
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+由粗到精模板匹配的回归测试
+
+用合成画面（纯色按钮 + 白色细字 "Accept"，背景为带噪声的杂乱文字，整体亮度偏移）
+把按钮放在奇数坐标上，验证粗层不会漏掉全分辨率下完全匹配的命中：
+降采样相位误差与按钮边缘的背景混叠曾让命中位置的粗层得分低于 threshold - 0.15。
+"""
+
+import numpy as np
+import cv2
+
+from utils.template_pyramid import build_coarse_template, coarse_to_fine_match
+from workers.scanner_process import _MatchBuffers, _prepare_template, _template_matching
+
+THRESHOLD = 0.8
+
+
+def _make_frame(seed):
+    """生成 (帧, 模板)：按钮位于奇数坐标，帧整体亮度偏移 ±30。"""
+    rng = np.random.default_rng(seed)
+    w, h = int(rng.integers(70, 130)), int(rng.integers(32, 46))
+    button = np.zeros((h, w, 3), np.uint8)
+    button[:] = tuple(int(c) for c in rng.integers(40, 200, 3))
+    scale = float(rng.uniform(0.4, 0.7))
+    (tw, tht), _ = cv2.getTextSize("Accept", cv2.FONT_HERSHEY_SIMPLEX, scale, 1)
+    cv2.putText(button, "Accept", ((w - tw) // 2, (h + tht) // 2),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 255), 1, cv2.LINE_AA)
+
+    frame = np.full((240, 360, 3), 30, np.uint8)
+    frame += rng.integers(0, 20, frame.shape).astype(np.uint8)
+    for _ in range(25):
+        text = "".join(chr(c) for c in rng.integers(97, 123, 8))
+        org = (int(rng.integers(0, 280)), int(rng.integers(10, 240)))
+        cv2.putText(frame, text, org, cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1, cv2.LINE_AA)
+
+    x = int(rng.integers(0, (360 - w) // 2)) * 2 + 1
+    y = int(rng.integers(0, (240 - h) // 2)) * 2 + 1
+    frame[y:y + h, x:x + w] = button
+    shift = int(rng.integers(-30, 31))
+    frame = np.clip(frame.astype(np.int16) + shift, 0, 255).astype(np.uint8)
+    return frame, button
+
+
+def test_coarse_to_fine_keeps_text_hits_at_odd_offsets():
+    """有粗模板时，达到阈值的命中得分与位置和全分辨率穷举一致。"""
+    checked = 0
+    for seed in range(40):
+        frame, button = _make_frame(seed)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        tpl_gray = cv2.cvtColor(button, cv2.COLOR_BGR2GRAY)
+        coarse = build_coarse_template(tpl_gray)
+        if coarse is None:
+            continue
+        _, ref_val, _, ref_loc = cv2.minMaxLoc(cv2.matchTemplate(gray, tpl_gray, cv2.TM_CCOEFF_NORMED))
+        assert ref_val >= THRESHOLD
+        score, loc = coarse_to_fine_match(gray, cv2.pyrDown(gray), tpl_gray, coarse, THRESHOLD)
+        assert abs(score - ref_val) < 1e-4, seed
+        assert loc == ref_loc, seed
+        checked += 1
+    assert checked > 0
+
+
+def test_template_matching_finds_text_buttons_at_odd_offsets():
+    """扫描进程的匹配入口不会把完全匹配的细字按钮报成未命中。"""
+    buffers = _MatchBuffers()
+    for seed in range(40):
+        frame, button = _make_frame(seed)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        tpl_gray = cv2.cvtColor(button, cv2.COLOR_BGR2GRAY)
+        ref_val = cv2.minMaxLoc(cv2.matchTemplate(gray, tpl_gray, cv2.TM_CCOEFF_NORMED))[1]
+        score, *_ = _template_matching(frame, [_prepare_template(button)], THRESHOLD, True, buffers)
+        assert score >= THRESHOLD, seed
+        assert abs(score - ref_val) < 1e-4, seed
+
+
+def test_threaded_matching_task_loads_templates_by_key(tmp_path):
+    """进程池匹配任务只收到模板键，在工作进程内加载模板，灰度与彩色模式都能命中。"""
+    from auto_approve import scanner_worker_refactored as worker
+
+    frame, button = _make_frame(3)
+    template_path = tmp_path / "button.png"
+    cv2.imwrite(str(template_path), button)
+    key = ((str(template_path),), "test")
+    for grayscale in (True, False):
+        result = worker.template_matching_task({
+            'roi_img': frame, 'templates_key': key, 'threshold': THRESHOLD,
+            'grayscale': grayscale, 'roi_offset': (0, 0), 'click_offset': (0, 0), 'task_id': 't'})
+        assert result['match_found'], (grayscale, result)
+        assert (key, grayscale) in worker._worker_templates
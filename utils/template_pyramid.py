@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+模板匹配的两级金字塔（由粗到精）工具
+
+扫描进程与线程池匹配任务共用：
+1. 模板加载时调用 build_coarse_template 生成 1/2 层粗模板并评估其保真度；
+2. 每帧对 ROI 做一次 pyrDown，调用 coarse_to_fine_match 在粗层全图搜索，
+   只在候选峰附近回到全分辨率精修。
+
+粗模板只保留 pyrDown 的内层像素：边缘一圈的值受模板外像素影响，实际画面中
+按钮周围的背景会让它们与模板自身降采样结果大相径庭（纯色按钮上细字的方差很小，
+这一圈边缘足以把命中位置的粗层得分压到阈值以下）。内层像素只取决于模板本身，
+剩下的差异来自命中位置的奇偶相位，由加载时的保真度评估计入粗层阈值。
+"""
+from __future__ import annotations
+
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+import cv2
+
+
+# 模板短边不小于该值才生成粗模板（过小的模板降采样后失去细节）
+PYRAMID_MIN_SIDE = 32
+# 粗模板保真度下限：奇偶相位下粗层自匹配得分低于该值的模板（如细笔画文字）不走粗层
+PYRAMID_MIN_FIDELITY = 0.85
+# 粗层阈值在扣除保真度损失之外的额外放宽量
+PYRAMID_SCORE_MARGIN = 0.15
+# 每个模板在粗层最多精修的候选峰数量，超出时该模板改为全分辨率匹配
+PYRAMID_MAX_PEAKS = 8
+# 精修窗口半径（全分辨率像素），覆盖候选峰附近 ±3 个粗层位置
+PYRAMID_REFINE_RADIUS = 8
+# 已精修峰的抑制半径（粗层像素），必须落在精修窗口覆盖范围内
+_SUPPRESS_RADIUS = (PYRAMID_REFINE_RADIUS - 2) // 2
+
+
+class CoarseTemplate(NamedTuple):
+    """1/2 层粗模板（pyrDown 后去掉边缘一圈）及其保真度"""
+    image: np.ndarray
+    fidelity: float
+
+
+def build_coarse_template(gray: np.ndarray) -> Optional[CoarseTemplate]:
+    """生成灰度模板的粗模板，模板过小或保真度不足时返回 None（只做全分辨率匹配）
+
+    保真度取模板以四种奇偶相位嵌入（边缘复制填充）后，粗模板在其 1/2 层上的最高
+    自匹配得分的最小值；它衡量降采样相位误差造成的得分损失，只需在加载时计算一次。
+    """
+    h, w = gray.shape[:2]
+    if min(w, h) < PYRAMID_MIN_SIDE:
+        return None
+    image = np.ascontiguousarray(cv2.pyrDown(gray)[1:-1, 1:-1])
+    fidelity = 1.0
+    for dy in (0, 1):
+        for dx in (0, 1):
+            canvas = cv2.copyMakeBorder(gray, 4 + dy, 4, 4 + dx, 4, cv2.BORDER_REPLICATE)
+            result = cv2.matchTemplate(cv2.pyrDown(canvas), image, cv2.TM_CCOEFF_NORMED)
+            fidelity = min(fidelity, float(result.max()))
+    if fidelity < PYRAMID_MIN_FIDELITY:
+        return None
+    return CoarseTemplate(image, fidelity)
+
+
+def coarse_to_fine_match(roi_gray: np.ndarray, roi_coarse: np.ndarray, tpl_gray: np.ndarray,
+                         coarse: CoarseTemplate, threshold: float,
+                         coarse_out: Optional[np.ndarray] = None,
+                         refine_buffer: Optional[Callable[[int, int], np.ndarray]] = None
+                         ) -> Tuple[float, Tuple[int, int]]:
+    """由粗到精匹配单个模板，返回 (得分, 全分辨率左上角位置)
+
+    粗层阈值为 threshold - (1 - 保真度) - PYRAMID_SCORE_MARGIN，得分达到它的峰按从高到低
+    精修；超过 PYRAMID_MAX_PEAKS 个峰仍未处理完时（杂乱背景上误峰过多）改为全分辨率匹配，
+    不会因为名额不足漏掉真实命中。没有候选峰时返回粗层最高分，它必然低于 threshold。
+
+    coarse_out 为粗层响应图的输出缓冲（形状须为 roi_coarse 与粗模板决定的响应图尺寸），
+    refine_buffer(h, w) 返回精修响应图的输出缓冲；均可省略，由 OpenCV 自行分配。
+    """
+    rh, rw = roi_gray.shape
+    th, tw = tpl_gray.shape
+    coarse_result = cv2.matchTemplate(roi_coarse, coarse.image, cv2.TM_CCOEFF_NORMED,
+                                      result=coarse_out)
+    _, peak_val, _, peak_loc = cv2.minMaxLoc(coarse_result)
+    coarse_threshold = threshold - (1.0 - coarse.fidelity) - PYRAMID_SCORE_MARGIN
+    if peak_val < coarse_threshold:
+        # 粗层位置 c 对应全分辨率约 2 * (c - 1)（粗模板去掉了边缘一圈）
+        return peak_val, (min(max(0, peak_loc[0] * 2 - 2), rw - tw),
+                          min(max(0, peak_loc[1] * 2 - 2), rh - th))
+
+    best_val, best_loc = -1.0, (0, 0)
+    for _ in range(PYRAMID_MAX_PEAKS):
+        cx, cy = peak_loc
+        x0 = max(0, cx * 2 - 2 - PYRAMID_REFINE_RADIUS)
+        y0 = max(0, cy * 2 - 2 - PYRAMID_REFINE_RADIUS)
+        x1 = min(rw - tw, cx * 2 - 2 + PYRAMID_REFINE_RADIUS)
+        y1 = min(rh - th, cy * 2 - 2 + PYRAMID_REFINE_RADIUS)
+        if x1 >= x0 and y1 >= y0:
+            out = refine_buffer(y1 - y0 + 1, x1 - x0 + 1) if refine_buffer is not None else None
+            refined = cv2.matchTemplate(roi_gray[y0:y1 + th, x0:x1 + tw], tpl_gray,
+                                        cv2.TM_CCOEFF_NORMED, result=out)
+            _, max_val, _, max_loc = cv2.minMaxLoc(refined)
+            if max_val > best_val:
+                best_val, best_loc = max_val, (x0 + max_loc[0], y0 + max_loc[1])
+
+        # 只抑制精修窗口已覆盖的粗层位置，再寻找下一个峰
+        coarse_result[max(0, cy - _SUPPRESS_RADIUS):cy + _SUPPRESS_RADIUS + 1,
+                      max(0, cx - _SUPPRESS_RADIUS):cx + _SUPPRESS_RADIUS + 1] = -1.0
+        _, peak_val, _, peak_loc = cv2.minMaxLoc(coarse_result)
+        if peak_val < coarse_threshold:
+            return best_val, best_loc
+
+    # 候选峰超出名额：整幅全分辨率匹配，保证达到阈值的位置不被遗漏
+    _, max_val, _, max_loc = cv2.minMaxLoc(
+        cv2.matchTemplate(roi_gray, tpl_gray, cv2.TM_CCOEFF_NORMED))
+    return max_val, max_loc
@@ -10,9 +10,18 @@
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import logging
+import os
+import random
+import sys
+import threading
 import time
 import traceback
-from typing import Any, Callable, Optional, Dict, List, Union, Coroutine
+from typing import Any, Callable, Optional, Dict, List, Tuple, Union, Coroutine
 from dataclasses import dataclass
 import json
 
@@ -30,8 +39,27 @@ except ImportError:
     QASYNC_AVAILABLE = False
     qasync = None
 
+# 可选的高性能JSON解码（orjson与json.loads都直接接受bytes）
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# 非GUI线程可选用libuv实现的事件循环（Windows下为winloop）
+try:
+    if sys.platform == 'win32':
+        import winloop as _fast_loop_impl
+    else:
+        import uvloop as _fast_loop_impl
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+    _fast_loop_impl = None
 
-@dataclass
+
+@dataclass(slots=True)
 class AsyncTaskResult:
     """异步任务结果"""
     task_id: str
@@ -42,6 +70,16 @@ class AsyncTaskResult:
     execution_time: float = 0.0
 
 
+@dataclass(slots=True, frozen=True)
+class CheckRecord:
+    """API监控的单次检查记录"""
+    check_number: int
+    timestamp: float
+    status_code: Optional[int]
+    response_time: Optional[float]
+    success: bool
+
+
 class AsyncTaskSignals(QObject):
     """异步任务信号类"""
     # 任务完成信号：(task_id, result)
@@ -52,34 +90,97 @@ class AsyncTaskSignals(QObject):
     task_progress = Signal(str, int, str)
 
 
+def create_worker_loop() -> asyncio.AbstractEventLoop:
+    """创建供非GUI线程使用的事件循环
+
+    可用时使用uvloop/winloop降低每次回调的开销；只创建循环实例而不修改全局策略，
+    避免影响GUI线程中的qasync事件循环。
+    """
+    if _fast_loop_impl is not None:
+        return _fast_loop_impl.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+class _BackgroundLoopThread:
+    """在独立线程中运行事件循环，承载与GUI无关的纯IO批量任务"""
+
+    def __init__(self):
+        self.loop = create_worker_loop()
+        self._thread = threading.Thread(target=self._run, name="AsyncBackgroundLoop", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+            # 循环停止后关闭该循环上的共享会话
+            self.loop.run_until_complete(close_shared_session())
+        finally:
+            self.loop.close()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self, timeout: float = 2.0):
+        if self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+
+
 class AsyncTaskManager(QObject):
     """异步任务管理器
     
     管理asyncio任务，与Qt事件循环集成
     """
     
+    # 自动生成任务ID用的单调计数器（同一毫秒内提交的任务也不会重复）
+    _task_counter = itertools.count(1)
+    
+    # 后台线程向GUI线程转交结果的内部信号（接收者是本对象，跨线程发射时自动排队）
+    _background_completed = Signal(str, object)
+    _background_failed = Signal(str, str, object)
+    
     def __init__(self):
         super().__init__()
         self._logger = get_logger()
         self.signals = AsyncTaskSignals()
+        # 必须持有任务的强引用：事件循环只弱引用任务，未被引用的任务可能在执行中被回收
         self._active_tasks: Dict[str, asyncio.Task] = {}
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        # 后台事件循环及其上的任务（在首次提交后台任务时启动）
+        self._background: Optional[_BackgroundLoopThread] = None
+        self._background_futures: Dict[str, concurrent.futures.Future] = {}
+        self._background_lock = threading.Lock()
+        # 按任务ID登记的回调 (on_success, on_error)，任务结束时取出并只调用一次
+        # 回调在事件循环线程（qasync下即GUI线程）中直接调用，不经过信号
+        self._callbacks: Dict[str, Tuple[Optional[Callable], Optional[Callable]]] = {}
+        # signals只服务于显式connect的观察者，没有观察者时跳过emit
+        self._completed_method = QtCore.QMetaMethod.fromSignal(self.signals.task_completed)
+        self._failed_method = QtCore.QMetaMethod.fromSignal(self.signals.task_failed)
+        self._background_completed.connect(self._dispatch_completed)
+        self._background_failed.connect(self._dispatch_failed)
         
         if not QASYNC_AVAILABLE:
             self._logger.error("qasync不可用，异步功能将被禁用")
             raise ImportError("qasync库未安装，请运行: pip install qasync")
     
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
-        """设置事件循环"""
+        """设置事件循环（须在运行该事件循环的线程中调用）"""
         self._loop = loop
+        self._loop_thread_id = threading.get_ident()
         self._logger.info("异步任务管理器已设置事件循环")
     
-    def submit_coroutine(self, coro: Coroutine, task_id: str = None) -> str:
+    def submit_coroutine(self, coro: Coroutine, task_id: str = None,
+                         on_success: Callable[[str, Any], None] = None,
+                         on_error: Callable[[str, str, Exception], None] = None) -> str:
         """提交协程任务
         
         Args:
             coro: 协程对象
             task_id: 任务ID，如果为None则自动生成
+            on_success: 仅针对该任务的成功回调
+            on_error: 仅针对该任务的失败回调
         
         Returns:
             str: 任务ID
@@ -88,50 +189,143 @@ class AsyncTaskManager(QObject):
             raise RuntimeError("事件循环未设置，请先调用set_event_loop")
         
         if task_id is None:
-            task_id = f"async_task_{int(time.time() * 1000)}"
+            task_id = f"async_task_{next(self._task_counter)}"
+        self._register_callbacks(task_id, on_success, on_error)
         
-        # 包装协程以处理结果和异常
-        wrapped_coro = self._wrap_coroutine(coro, task_id)
-        
-        # 创建任务
-        task = self._loop.create_task(wrapped_coro)
-        self._active_tasks[task_id] = task
+        if threading.get_ident() == self._loop_thread_id:
+            self._start_task(coro, task_id, time.perf_counter())
+        else:
+            # 从其他线程（如工作QThread）提交时转交事件循环线程创建任务
+            self._loop.call_soon_threadsafe(self._start_task, coro, task_id, time.perf_counter())
         
         self._logger.debug(f"提交异步任务: {task_id}")
         return task_id
     
-    async def _wrap_coroutine(self, coro: Coroutine, task_id: str):
-        """包装协程以处理结果和异常"""
-        start_time = time.time()
+    def _start_task(self, coro: Coroutine, task_id: str, start_time: float):
+        """在事件循环线程中创建任务"""
+        # 启用eager任务工厂时协程可能在此处就已同步执行完毕
+        task = self._loop.create_task(coro, name=task_id)
+        if not task.done():
+            self._active_tasks[task_id] = task
+        # 完成回调负责发信号和清理，不再额外包一层协程
+        task.add_done_callback(functools.partial(self._on_task_done, task_id, start_time))
+    
+    def _on_task_done(self, task_id: str, start_time: float, task: asyncio.Task):
+        """任务完成回调：处理结果和异常"""
+        # 从活跃任务中移除（按对象身份比较，避免误删同ID的新任务）
+        if self._active_tasks.get(task_id) is task:
+            del self._active_tasks[task_id]
         
-        try:
-            result = await coro
-            execution_time = time.time() - start_time
-            
-            # 发送成功信号
-            self.signals.task_completed.emit(task_id, result)
+        if task.cancelled():
+            self._callbacks.pop(task_id, None)
+            return
+        
+        execution_time = time.perf_counter() - start_time
+        exc = task.exception()
+        if exc is None:
+            self._dispatch_completed(task_id, task.result())
             self._logger.debug(f"异步任务 {task_id} 完成，耗时: {execution_time:.3f}s")
+        else:
+            error_msg = f"异步任务执行失败: {str(exc)}"
             
-        except Exception as e:
-            execution_time = time.time() - start_time
-            error_msg = f"异步任务执行失败: {str(e)}"
-            
-            # 发送失败信号
-            self.signals.task_failed.emit(task_id, error_msg, e)
+            self._dispatch_failed(task_id, error_msg, exc)
             self._logger.error(f"异步任务 {task_id} 失败: {error_msg}")
-            self._logger.debug(f"异常详情: {traceback.format_exc()}")
-        
-        finally:
-            # 从活跃任务中移除
-            if task_id in self._active_tasks:
-                del self._active_tasks[task_id]
+            # 只在DEBUG级别开启时才格式化调用栈，避免失败密集时白白构造大字符串
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("异常详情: %s", ''.join(
+                    traceback.format_exception(type(exc), exc, exc.__traceback__)))
+    
+    def _register_callbacks(self, task_id: str, on_success: Optional[Callable],
+                            on_error: Optional[Callable]):
+        """登记任务专属回调"""
+        if on_success or on_error:
+            self._callbacks[task_id] = (on_success, on_error)
+
+    def _dispatch_completed(self, task_id: str, result: Any):
+        """分发完成结果：直接调用该任务登记的回调，有观察者时再发信号"""
+        callbacks = self._callbacks.pop(task_id, None)
+        if callbacks and callbacks[0]:
+            callbacks[0](task_id, result)
+        if self.signals.isSignalConnected(self._completed_method):
+            self.signals.task_completed.emit(task_id, result)
+
+    def _dispatch_failed(self, task_id: str, error_msg: str, exc: Exception):
+        """分发失败结果：直接调用该任务登记的回调，有观察者时再发信号"""
+        callbacks = self._callbacks.pop(task_id, None)
+        if callbacks and callbacks[1]:
+            callbacks[1](task_id, error_msg, exc)
+        if self.signals.isSignalConnected(self._failed_method):
+            self.signals.task_failed.emit(task_id, error_msg, exc)
     
+    def submit_background(self, coro: Coroutine, task_id: str = None,
+                          on_success: Callable[[str, Any], None] = None,
+                          on_error: Callable[[str, str, Exception], None] = None) -> str:
+        """提交协程到后台事件循环线程执行
+
+        适用于不触碰GUI对象的纯IO任务（批量请求、文件下载），
+        让qasync循环只处理与界面相关的任务。结果仍通过signals在GUI线程发出。
+        """
+        if task_id is None:
+            task_id = f"async_bg_task_{next(self._task_counter)}"
+        self._register_callbacks(task_id, on_success, on_error)
+
+        with self._background_lock:
+            if self._background is None or not self._background.is_alive():
+                self._background = _BackgroundLoopThread()
+                self._logger.info(f"后台事件循环已启动 (uvloop/winloop: {FAST_LOOP_AVAILABLE})")
+            future = asyncio.run_coroutine_threadsafe(coro, self._background.loop)
+            self._background_futures[task_id] = future
+
+        future.add_done_callback(functools.partial(self._on_background_done, task_id, time.perf_counter()))
+        self._logger.debug(f"提交后台异步任务: {task_id}")
+        return task_id
+
+    def _on_background_done(self, task_id: str, start_time: float,
+                            future: concurrent.futures.Future):
+        """后台任务完成回调（在后台线程执行），通过内部信号转回GUI线程分发结果"""
+        with self._background_lock:
+            self._background_futures.pop(task_id, None)
+        if future.cancelled():
+            self._callbacks.pop(task_id, None)
+            return
+
+        execution_time = time.perf_counter() - start_time
+        exc = future.exception()
+        if exc is None:
+            self._logger.debug(f"后台异步任务 {task_id} 完成，耗时: {execution_time:.3f}s")
+            self._background_completed.emit(task_id, future.result())
+        else:
+            error_msg = f"异步任务执行失败: {str(exc)}"
+            self._logger.error(f"后台异步任务 {task_id} 失败: {error_msg}")
+            self._background_failed.emit(task_id, error_msg, exc)
+
+    def stop_background_loop(self):
+        """取消后台任务并停止后台事件循环线程"""
+        with self._background_lock:
+            background = self._background
+            self._background = None
+            futures = list(self._background_futures.values())
+            self._background_futures.clear()
+        for future in futures:
+            future.cancel()
+        if background is not None:
+            background.stop()
+            self._logger.info("后台事件循环已停止")
+
     def cancel_task(self, task_id: str) -> bool:
-        """取消指定任务"""
-        if task_id in self._active_tasks:
-            task = self._active_tasks[task_id]
+        """取消指定任务
+
+        只发出取消请求，映射表中的条目由完成回调在取消真正生效后清理。
+        """
+        with self._background_lock:
+            future = self._background_futures.get(task_id)
+        if future is not None:
+            future.cancel()
+            self._logger.info(f"已取消后台异步任务: {task_id}")
+            return True
+        task = self._active_tasks.get(task_id)
+        if task is not None:
             task.cancel()
-            del self._active_tasks[task_id]
             self._logger.info(f"已取消异步任务: {task_id}")
             return True
         return False
@@ -140,63 +334,242 @@ class AsyncTaskManager(QObject):
         """取消所有任务"""
         for task_id in list(self._active_tasks.keys()):
             self.cancel_task(task_id)
+        with self._background_lock:
+            background_ids = list(self._background_futures.keys())
+        for task_id in background_ids:
+            self.cancel_task(task_id)
         self._logger.info("已取消所有异步任务")
     
     def get_active_task_count(self) -> int:
         """获取活跃任务数量"""
-        return len(self._active_tasks)
+        return len(self._active_tasks) + len(self._background_futures)
+
+
+# ==================== 共享HTTP会话 ====================
+
+# 共享会话：复用连接池，避免每次请求都重新握手TCP/TLS
+# ClientSession绑定创建它的事件循环，因此每个事件循环各持有一个
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _read_http_concurrency() -> int:
+    """读取进程内HTTP并发预算（环境变量 ASYNC_HTTP_MAX_CONCURRENCY，默认100）"""
+    try:
+        return max(1, int(os.environ.get('ASYNC_HTTP_MAX_CONCURRENCY', '100')))
+    except ValueError:
+        return 100
+
+
+# 每个事件循环的HTTP并发预算；连接池上限与之相同，避免请求在连接器内部排队
+_HTTP_MAX_CONCURRENCY = _read_http_concurrency()
+_POOL_LIMIT = _HTTP_MAX_CONCURRENCY
+_POOL_LIMIT_PER_HOST = min(32, _POOL_LIMIT)
+
+
+# AIMD参数：过载时许可数减半，连续成功这么多次后许可数加一
+_AIMD_INCREASE_EVERY = 32
+# 视为服务端过载的状态码
+_OVERLOAD_STATUSES = frozenset((429, 503))
+# 过载重试：指数退避基数（秒）和最大重试次数
+_BACKOFF_BASE = 0.5
+_MAX_RETRIES = 5
+
+
+class _HttpLimiter:
+    """单个事件循环内的HTTP并发限制器
+
+    按AIMD调整有效许可数：遇到429/503时减半，连续成功后逐个加回上限，
+    让并发贴近服务端的实际承载能力。同时统计在途请求数。
+    """
+
+    def __init__(self, limit: int):
+        self._cond = asyncio.Condition()
+        self.limit = limit
+        self.permits = limit
+        self.in_flight = 0
+        self._successes = 0
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.permits)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self.in_flight -= 1
+            # 许可数刚被加回时可能一次放行多个等待者
+            self._cond.notify(max(1, self.permits - self.in_flight))
+
+    def on_success(self):
+        """记录一次成功请求，累计足够次数后加性增加许可数"""
+        self._successes += 1
+        if self._successes >= _AIMD_INCREASE_EVERY:
+            self._successes = 0
+            if self.permits < self.limit:
+                self.permits += 1
+
+    def on_overload(self):
+        """记录一次过载响应，乘性减少许可数"""
+        self._successes = 0
+        self.permits = max(1, self.permits // 2)
+
+
+# asyncio.Semaphore同样绑定事件循环，按循环各建一个
+_http_limiters: Dict[asyncio.AbstractEventLoop, _HttpLimiter] = {}
+
+
+def _get_http_limiter() -> _HttpLimiter:
+    """获取当前事件循环的HTTP并发限制器"""
+    loop = asyncio.get_running_loop()
+    limiter = _http_limiters.get(loop)
+    if limiter is None:
+        limiter = _http_limiters[loop] = _HttpLimiter(_HTTP_MAX_CONCURRENCY)
+    return limiter
+
+
+@contextlib.asynccontextmanager
+async def _request_with_aimd(session: aiohttp.ClientSession, method: str, url: str,
+                             max_retries: int = _MAX_RETRIES, **kwargs):
+    """在并发预算内发起请求，遇到429/503时退避重试
+
+    退避时间为 base * 2**attempt * random()（full jitter），服务端给出的
+    Retry-After更长时以其为准。重试用尽后把最后一次过载响应交给调用方。
+    """
+    limiter = _get_http_limiter()
+    for attempt in range(max_retries + 1):
+        async with limiter:
+            response = await session.request(method, url, **kwargs)
+            overloaded = response.status in _OVERLOAD_STATUSES
+            if overloaded:
+                limiter.on_overload()
+                get_logger().warning(
+                    f"HTTP {response.status}: {url}，当前在途请求 {limiter.in_flight}，"
+                    f"并发许可降至 {limiter.permits}/{limiter.limit}")
+            else:
+                limiter.on_success()
+
+            if not overloaded or attempt == max_retries:
+                try:
+                    yield response
+                finally:
+                    response.release()
+                return
+
+            retry_after = response.headers.get('Retry-After', '')
+            response.release()
+
+        delay = _BACKOFF_BASE * (2 ** attempt) * random.random()
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        await asyncio.sleep(delay)
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """获取当前事件循环的共享ClientSession（首次使用时延迟创建）"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=_POOL_LIMIT, limit_per_host=_POOL_LIMIT_PER_HOST,
+                                         ttl_dns_cache=300, keepalive_timeout=75)
+        # 会话本身不设总超时，由每个请求单独指定（普通请求见 async_http_request，下载见 _DOWNLOAD_TIMEOUT）
+        session = aiohttp.ClientSession(connector=connector,
+                                        timeout=aiohttp.ClientTimeout(total=None))
+        _sessions[loop] = session
+    return session
+
+
+async def close_shared_session():
+    """关闭当前事件循环的共享ClientSession"""
+    loop = asyncio.get_running_loop()
+    _http_limiters.pop(loop, None)
+    session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _decode_text(raw: bytes, charset: Optional[str]) -> str:
+    """按响应声明的字符集解码文本，未声明或无法识别时使用UTF-8"""
+    try:
+        return raw.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
 
 
 # ==================== 异步任务函数 ====================
 
 async def async_http_request(url: str, method: str = 'GET', 
                            headers: Dict = None, data: Any = None,
-                           timeout: int = 30) -> Dict[str, Any]:
+                           timeout: int = 30,
+                           session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     """异步HTTP请求"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
+    if session is None:
+        session = await _get_session()
     timeout_obj = aiohttp.ClientTimeout(total=timeout)
     
-    async with aiohttp.ClientSession(timeout=timeout_obj) as session:
-        async with session.request(method, url, headers=headers, data=data) as response:
-            # 尝试解析JSON，失败则返回文本
+    async with _request_with_aimd(session, method, url, headers=headers, data=data,
+                                  timeout=timeout_obj) as response:
+        # 只读取一次响应体，按Content-Type决定按JSON还是文本解码
+        raw = await response.read()
+        content_type = 'text'
+        if 'json' in response.headers.get('Content-Type', ''):
             try:
-                content = await response.json()
+                content = _json_loads(raw)
                 content_type = 'json'
-            except:
-                content = await response.text()
-                content_type = 'text'
-            
-            execution_time = time.time() - start_time
-            
-            return {
-                'url': url,
-                'method': method,
-                'status_code': response.status,
-                'headers': dict(response.headers),
-                'content': content,
-                'content_type': content_type,
-                'execution_time': execution_time
-            }
+            except ValueError:
+                pass  # 声明为JSON但内容不合法，按文本返回
+        if content_type == 'text':
+            content = _decode_text(raw, response.charset)
+        
+        execution_time = time.perf_counter() - start_time
+        
+        return {
+            'url': url,
+            'method': method,
+            'status_code': response.status,
+            # 直接返回只读的CIMultiDictProxy（大小写不敏感），不再逐项复制成dict；
+            # 需要普通dict的调用方（如 io_tasks 的异步HTTP路径）自行 dict(...) 转换
+            'headers': response.headers,
+            'content': content,
+            'content_type': content_type,
+            'execution_time': execution_time
+        }
 
 
 async def async_websocket_client(url: str, messages: List[str] = None,
                                timeout: int = 30) -> Dict[str, Any]:
     """异步WebSocket客户端"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     received_messages = []
     
     try:
-        async with websockets.connect(url, timeout=timeout) as websocket:
-            # 发送消息
+        # 控制面消息很小，关闭permessage-deflate压缩省去每条消息的zlib开销
+        async with websockets.connect(url, open_timeout=timeout, compression=None,
+                                      max_size=2 ** 20, ping_interval=20,
+                                      ping_timeout=20) as websocket:
+            # 发送与接收流水线并行：连续发出全部消息，同时按序接收响应，
+            # 总耗时不再是 消息数 × RTT（WebSocket上响应按FIFO顺序到达，配对关系不变）
             if messages:
-                for msg in messages:
-                    await websocket.send(msg)
-                    # 接收响应
-                    response = await websocket.recv()
-                    received_messages.append(response)
+                async def send_all():
+                    for msg in messages:
+                        await websocket.send(msg)
+                
+                async def receive_all():
+                    for _ in range(len(messages)):
+                        received_messages.append(await websocket.recv())
+                
+                pipes = [asyncio.ensure_future(send_all()), asyncio.ensure_future(receive_all())]
+                try:
+                    await asyncio.gather(*pipes)
+                except BaseException:
+                    for pipe in pipes:
+                        pipe.cancel()
+                    await asyncio.gather(*pipes, return_exceptions=True)
+                    raise
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             return {
                 'url': url,
@@ -207,7 +580,7 @@ async def async_websocket_client(url: str, messages: List[str] = None,
             }
     
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         return {
             'url': url,
             'connected': False,
@@ -219,12 +592,15 @@ async def async_websocket_client(url: str, messages: List[str] = None,
 async def async_batch_http_requests(urls: List[str], method: str = 'GET',
                                   max_concurrent: int = 10) -> List[Dict[str, Any]]:
     """批量异步HTTP请求"""
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # 并发数不超过连接池上限，保证由信号量而不是连接器内部队列来排队
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrent, _POOL_LIMIT)))
+    # 整批请求共享同一个会话和连接池
+    session = await _get_session()
     
     async def fetch_one(url: str) -> Dict[str, Any]:
         async with semaphore:
             try:
-                return await async_http_request(url, method)
+                return await async_http_request(url, method, session=session)
             except Exception as e:
                 return {
                     'url': url,
@@ -233,82 +609,246 @@ async def async_batch_http_requests(urls: List[str], method: str = 'GET',
                 }
     
     # 并发执行所有请求
-    tasks = [fetch_one(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # 处理异常结果
-    processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            processed_results.append({
-                'url': urls[i],
-                'error': str(result),
-                'success': False
-            })
-        else:
-            processed_results.append(result)
-    
-    return processed_results
+    # fetch_one内部已捕获异常，结果可直接按顺序收集
+    if hasattr(asyncio, 'TaskGroup'):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_one(url)) for url in urls]
+        return [task.result() for task in tasks]
 
+    return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
 
-async def async_file_download(url: str, file_path: str, 
-                            chunk_size: int = 8192) -> Dict[str, Any]:
-    """异步文件下载"""
-    start_time = time.time()
+
+# 下载写盘使用的打开标志（Windows需显式指定二进制模式）
+_DOWNLOAD_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# 分段下载参数：文件小于该值时不值得拆分
+_RANGE_MIN_PART_SIZE = 1 << 20
+
+# 下载超时：大文件不限总时长，但连接建立与两次读取之间的间隔有上限，服务器卡住时及时失败
+_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+
+
+class _RangeNotSupported(Exception):
+    """服务器忽略了Range请求头"""
+
+
+def _write_all(fd: int, data: bytes):
+    """把数据完整写入文件描述符（处理部分写入）"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_at(fd: int, data: bytes, offset: int):
+    """在指定偏移处写入数据
+
+    Windows没有os.pwrite，改用lseek+write；两步之间没有await，
+    在单线程事件循环中不会被其他分段协程打断。
+    """
+    if hasattr(os, 'pwrite'):
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        _write_all(fd, data)
+
+
+def _preallocate(fd: int, size: int):
+    """尽量预分配磁盘空间，减少文件系统元数据更新"""
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # 文件系统不支持预分配时直接写入即可
+
+
+async def _probe_range_support(session: aiohttp.ClientSession, url: str) -> int:
+    """HEAD探测文件大小和Range支持，不支持分段时返回0"""
+    try:
+        async with session.head(url, allow_redirects=True, timeout=_DOWNLOAD_TIMEOUT,
+                                headers={'Accept-Encoding': 'identity'}) as response:
+            if response.status >= 400:
+                return 0
+            if response.headers.get('Accept-Ranges', '').lower() != 'bytes':
+                return 0
+            return int(response.headers.get('Content-Length', 0))
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return 0
+
+
+async def _download_single(session: aiohttp.ClientSession, url: str, file_path: str,
+                           chunk_size: int) -> tuple:
+    """单连接顺序下载，返回 (downloaded_bytes, total_size)"""
     downloaded_bytes = 0
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            response.raise_for_status()
+    async with _request_with_aimd(session, 'GET', url, timeout=_DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        
+        total_size = int(response.headers.get('content-length', 0))
+        
+        fd = os.open(file_path, _DOWNLOAD_OPEN_FLAGS, 0o644)
+        try:
+            _preallocate(fd, total_size)
             
-            total_size = int(response.headers.get('content-length', 0))
+            async for chunk in response.content.iter_chunked(chunk_size):
+                _write_all(fd, chunk)
+                downloaded_bytes += len(chunk)
             
-            with open(file_path, 'wb') as f:
+            # 实际长度与Content-Length不符（如内容编码）时截掉预分配的多余部分
+            if downloaded_bytes < total_size:
+                os.ftruncate(fd, downloaded_bytes)
+        finally:
+            os.close(fd)
+    
+    return downloaded_bytes, total_size
+
+
+async def _download_ranges(session: aiohttp.ClientSession, url: str, file_path: str,
+                           total_size: int, chunk_size: int, max_connections: int) -> int:
+    """多连接分段下载，每段直接写入文件中对应的偏移，返回下载字节数
+
+    分段数多于连接数，由信号量控制并发，慢连接只会拖住一个较小的分段。
+    """
+    part_size = max(_RANGE_MIN_PART_SIZE, -(-total_size // (max_connections * 4)))
+    semaphore = asyncio.Semaphore(max_connections)
+    
+    async def fetch_part(start: int, end: int) -> int:
+        async with semaphore:
+            headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+            async with _request_with_aimd(session, 'GET', url, headers=headers,
+                                          timeout=_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                if response.status != 206:
+                    raise _RangeNotSupported(url)
+                offset = start
                 async for chunk in response.content.iter_chunked(chunk_size):
-                    f.write(chunk)
-                    downloaded_bytes += len(chunk)
-            
-            execution_time = time.time() - start_time
-            
-            return {
-                'url': url,
-                'file_path': file_path,
-                'downloaded_bytes': downloaded_bytes,
-                'total_size': total_size,
-                'execution_time': execution_time,
-                'success': True
-            }
+                    _write_at(fd, chunk, offset)
+                    offset += len(chunk)
+                return offset - start
+    
+    fd = os.open(file_path, _DOWNLOAD_OPEN_FLAGS, 0o644)
+    try:
+        _preallocate(fd, total_size)
+        parts = [asyncio.ensure_future(fetch_part(start, min(start + part_size, total_size) - 1))
+                 for start in range(0, total_size, part_size)]
+        try:
+            sizes = await asyncio.gather(*parts)
+        except BaseException:
+            for part in parts:
+                part.cancel()
+            await asyncio.gather(*parts, return_exceptions=True)
+            raise
+    finally:
+        os.close(fd)
+    
+    downloaded_bytes = sum(sizes)
+    if downloaded_bytes != total_size:
+        raise aiohttp.ClientPayloadError(
+            f"分段下载不完整: {downloaded_bytes}/{total_size} 字节")
+    return downloaded_bytes
 
 
-async def async_api_monitoring(api_urls: List[str], check_interval: int = 60,
-                             max_checks: int = 10) -> Dict[str, Any]:
-    """异步API监控"""
-    results = {}
+async def async_file_download(url: str, file_path: str, 
+                            chunk_size: int = 1 << 16,
+                            max_connections: int = 8) -> Dict[str, Any]:
+    """异步文件下载
+
+    服务器支持Range且文件足够大时，用多个连接并发下载不同分段；
+    否则退回单连接顺序下载。写盘直接使用原始文件描述符，绕过Python缓冲IO层。
+    """
+    start_time = time.perf_counter()
     
-    for check_num in range(max_checks):
-        check_start = time.time()
-        
-        # 并发检查所有API
-        check_results = await async_batch_http_requests(api_urls)
-        
-        # 记录结果
-        for result in check_results:
-            url = result['url']
-            if url not in results:
-                results[url] = []
-            
-            results[url].append({
-                'check_number': check_num + 1,
-                'timestamp': check_start,
-                'status_code': result.get('status_code'),
-                'response_time': result.get('execution_time'),
-                'success': 'error' not in result
-            })
-        
-        # 等待下次检查
-        if check_num < max_checks - 1:
-            await asyncio.sleep(check_interval)
+    session = await _get_session()
+    total_size = 0
+    if max_connections > 1:
+        total_size = await _probe_range_support(session, url)
     
+    parallel = total_size >= 2 * _RANGE_MIN_PART_SIZE
+    if parallel:
+        try:
+            downloaded_bytes = await _download_ranges(session, url, file_path, total_size,
+                                                      chunk_size, max_connections)
+        except _RangeNotSupported:
+            parallel = False
+    if not parallel:
+        downloaded_bytes, total_size = await _download_single(session, url, file_path, chunk_size)
+    
+    execution_time = time.perf_counter() - start_time
+    
+    return {
+        'url': url,
+        'file_path': file_path,
+        'downloaded_bytes': downloaded_bytes,
+        'total_size': total_size,
+        'parallel': parallel,
+        'execution_time': execution_time,
+        'success': True
+    }
+
+
+async def async_api_monitoring(api_urls: List[str], check_interval: int = 60,
+                             max_checks: int = 10,
+                             max_workers: int = 16) -> Dict[str, List[Optional[CheckRecord]]]:
+    """异步API监控，返回每个URL按检查序号排列的CheckRecord列表
+
+    每轮检查的请求按 check_interval / len(api_urls) 的节奏均匀投递到队列，
+    由固定数量的消费者协程处理。慢接口只占用一个消费者，不会拖住整轮检查，
+    同时在途协程数量有上限。
+    """
+    # 结果按检查序号直接写入预分配的位置，消费者乱序完成也不影响顺序
+    results = {url: [None] * max_checks for url in api_urls}
+    if not api_urls or max_checks <= 0:
+        return results
+
+    session = await _get_session()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_workers * 2)
+    spacing = check_interval / len(api_urls)
+    total = max_checks * len(api_urls)
+    # 预先绑定每个URL的结果列表，消费者写入时不必再查一次results字典
+    targets = [(url, results[url]) for url in api_urls]
+
+    async def producer():
+        sent = 0
+        for check_num in range(max_checks):
+            for url, slots in targets:
+                await queue.put((check_num, url, slots, time.time()))
+                sent += 1
+                # 最后一个请求之后不再等待
+                if sent < total:
+                    await asyncio.sleep(spacing)
+
+    async def consumer():
+        while True:
+            check_num, url, slots, timestamp = await queue.get()
+            try:
+                try:
+                    result = await async_http_request(url, session=session)
+                except Exception as e:
+                    result = {'url': url, 'error': str(e)}
+
+                slots[check_num] = CheckRecord(
+                    check_number=check_num + 1,
+                    timestamp=timestamp,
+                    status_code=result.get('status_code'),
+                    response_time=result.get('execution_time'),
+                    success='error' not in result
+                )
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(consumer())
+               for _ in range(max(1, min(max_workers, len(api_urls))))]
+    try:
+        await producer()
+        await queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
     return results
 
 
@@ -332,10 +872,26 @@ def setup_qasync_event_loop(app) -> asyncio.AbstractEventLoop:
     loop = qasync.QEventLoop(app)
     asyncio.set_event_loop(loop)
 
+    # Python 3.12+：无需挂起即可完成的短协程直接同步执行，不必排队等待调度
+    if hasattr(asyncio, 'eager_task_factory'):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     # 设置到异步任务管理器
     manager = get_global_async_manager()
     manager.set_event_loop(loop)
 
+    # 退出时关闭共享HTTP会话并停止后台事件循环
+    def _close_session_on_quit():
+        manager.stop_background_loop()
+        if loop not in _sessions:
+            return
+        if loop.is_running():
+            loop.create_task(close_shared_session())
+        else:
+            loop.run_until_complete(close_shared_session())
+
+    app.aboutToQuit.connect(_close_session_on_quit)
+
     return loop
 
 
@@ -348,15 +904,8 @@ def submit_async_http(url: str, method: str = 'GET', headers: Dict = None,
                      task_id: str = None) -> str:
     """便捷函数：提交异步HTTP请求"""
     manager = get_global_async_manager()
-
-    # 连接信号
-    if on_success:
-        manager.signals.task_completed.connect(on_success)
-    if on_error:
-        manager.signals.task_failed.connect(on_error)
-
     coro = async_http_request(url, method, headers, data, timeout)
-    return manager.submit_coroutine(coro, task_id)
+    return manager.submit_coroutine(coro, task_id, on_success, on_error)
 
 
 def submit_async_websocket(url: str, messages: List[str] = None, timeout: int = 30,
@@ -365,15 +914,8 @@ def submit_async_websocket(url: str, messages: List[str] = None, timeout: int =
                           task_id: str = None) -> str:
     """便捷函数：提交异步WebSocket任务"""
     manager = get_global_async_manager()
-
-    # 连接信号
-    if on_success:
-        manager.signals.task_completed.connect(on_success)
-    if on_error:
-        manager.signals.task_failed.connect(on_error)
-
     coro = async_websocket_client(url, messages, timeout)
-    return manager.submit_coroutine(coro, task_id)
+    return manager.submit_coroutine(coro, task_id, on_success, on_error)
 
 
 def submit_async_batch_requests(urls: List[str], method: str = 'GET',
@@ -383,32 +925,18 @@ def submit_async_batch_requests(urls: List[str], method: str = 'GET',
                                task_id: str = None) -> str:
     """便捷函数：提交批量异步HTTP请求"""
     manager = get_global_async_manager()
-
-    # 连接信号
-    if on_success:
-        manager.signals.task_completed.connect(on_success)
-    if on_error:
-        manager.signals.task_failed.connect(on_error)
-
     coro = async_batch_http_requests(urls, method, max_concurrent)
-    return manager.submit_coroutine(coro, task_id)
+    return manager.submit_coroutine(coro, task_id, on_success, on_error)
 
 
-def submit_async_download(url: str, file_path: str, chunk_size: int = 8192,
+def submit_async_download(url: str, file_path: str, chunk_size: int = 1 << 16,
                          on_success: Callable[[str, Any], None] = None,
                          on_error: Callable[[str, str, Exception], None] = None,
                          task_id: str = None) -> str:
     """便捷函数：提交异步文件下载"""
     manager = get_global_async_manager()
-
-    # 连接信号
-    if on_success:
-        manager.signals.task_completed.connect(on_success)
-    if on_error:
-        manager.signals.task_failed.connect(on_error)
-
     coro = async_file_download(url, file_path, chunk_size)
-    return manager.submit_coroutine(coro, task_id)
+    return manager.submit_coroutine(coro, task_id, on_success, on_error)
 
 
 def submit_async_monitoring(api_urls: List[str], check_interval: int = 60,
@@ -418,15 +946,20 @@ def submit_async_monitoring(api_urls: List[str], check_interval: int = 60,
                            task_id: str = None) -> str:
     """便捷函数：提交异步API监控"""
     manager = get_global_async_manager()
+    coro = async_api_monitoring(api_urls, check_interval, max_checks)
+    return manager.submit_coroutine(coro, task_id, on_success, on_error)
 
-    # 连接信号
-    if on_success:
-        manager.signals.task_completed.connect(on_success)
-    if on_error:
-        manager.signals.task_failed.connect(on_error)
 
-    coro = async_api_monitoring(api_urls, check_interval, max_checks)
-    return manager.submit_coroutine(coro, task_id)
+def submit_background_async(coro: Coroutine,
+                            on_success: Callable[[str, Any], None] = None,
+                            on_error: Callable[[str, str, Exception], None] = None,
+                            task_id: str = None) -> str:
+    """便捷函数：提交协程到后台事件循环线程
+
+    用于async_batch_http_requests、async_file_download等不触碰GUI的IO任务。
+    """
+    manager = get_global_async_manager()
+    return manager.submit_background(coro, task_id, on_success, on_error)
 
 
 def cancel_async_task(task_id: str) -> bool:
@@ -447,5 +980,6 @@ def get_async_stats() -> Dict[str, Any]:
     return {
         'active_tasks': manager.get_active_task_count(),
         'qasync_available': QASYNC_AVAILABLE,
+        'fast_loop_available': FAST_LOOP_AVAILABLE,
         'event_loop_set': manager._loop is not None
     }
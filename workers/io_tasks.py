@@ -9,14 +9,24 @@ IO密集型任务模块
 - 全局QThreadPool复用，提供submit_io工具函数
 """
 
+import codecs
+import copy
+import functools
+import itertools
 import os
 import json
+import mmap
+import re
+import threading
 import time
 import traceback
-from typing import Any, Callable, Optional, Dict, List
-from pathlib import Path
+from collections import deque
+from typing import Any, Callable, Optional, Dict, List, Tuple
+from pathlib import Path, PurePath
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import cv2
 import numpy as np
 from PySide6 import QtCore
@@ -24,10 +34,57 @@ from PySide6.QtCore import QRunnable, QObject, Signal, QThreadPool, QTimer
 
 from auto_approve.logger_manager import get_logger
 
+# 可选的高性能JSON编解码（orjson直接处理UTF-8字节）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选依赖：Hyperscan多模式匹配引擎，用于日志关键字扫描
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+# 可选依赖：Numba JIT，没有Hyperscan时用于编译日志关键字统计循环
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def _is_utf8(encoding: str) -> bool:
+    """编码名是否为UTF-8（兼容utf8、UTF_8等写法）"""
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _json_loads_bytes(data: bytes, encoding: str = 'utf-8') -> Any:
+    """从字节解析JSON；UTF-8内容直接交给解析器，省去Python侧解码"""
+    loads = orjson.loads if orjson is not None else json.loads
+    if _is_utf8(encoding):
+        return loads(data)
+    return loads(data.decode(encoding))
+
+
+def _json_dumps_bytes(obj: Any, encoding: str = 'utf-8') -> bytes:
+    """把对象序列化为缩进2格、保留非ASCII字符的JSON字节"""
+    if orjson is not None and _is_utf8(encoding):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # orjson不支持的类型（如超过64位的整数），交给标准库处理
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode(encoding)
+
 
 class WorkerSignals(QObject):
     """工作线程信号类"""
     # 成功信号：(task_id, result)
+    # object类型参数跨线程排队时只传递Python对象引用（不序列化、不复制），
+    # 大尺寸ndarray结果可直接通过信号返回，无需额外的结果存储
     ok = Signal(str, object)
     # 错误信号：(task_id, error_message, exception)
     err = Signal(str, str, object)
@@ -35,6 +92,97 @@ class WorkerSignals(QObject):
     progress = Signal(str, int, str)
 
 
+class _Dispatcher(WorkerSignals):
+    """全局信号分发器
+    
+    所有IO任务共用这一个QObject发射信号，不再为每个任务创建WorkerSignals。
+    信号携带任务的内部分发键，分发器在GUI线程按键查找回调并调用。
+    同时合并相同的在途任务：多个调用方共享一次执行，除第一个外各自收到结果的深拷贝。
+    """
+    
+    def __init__(self):
+        super().__init__()
+        # 分发键 -> [(task_id, on_success, on_error, on_progress), ...]
+        self._callbacks: Dict[str, list] = {}
+        # 去重键 -> 正在执行的任务分发键；以及反向映射，任务结束时清理
+        self._inflight: Dict[tuple, str] = {}
+        self._dedup_keys: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.ok.connect(self._on_ok)
+        self.err.connect(self._on_err)
+        self.progress.connect(self._on_progress)
+    
+    def register(self, task: 'IOTaskBase',
+                 on_success: Callable[[str, Any], None] = None,
+                 on_error: Callable[[str, str, Exception], None] = None,
+                 on_progress: Callable[[str, int, str], None] = None) -> bool:
+        """登记任务回调（任务结束时自动移除）
+        
+        如果已有去重键相同的任务正在执行，则把回调挂到该任务上并返回True，
+        调用方无需再执行此任务。
+        """
+        entry = (task.task_id, on_success, on_error, on_progress)
+        dedup_key = task.dedup_key()
+        with self._lock:
+            if dedup_key is not None:
+                running = self._inflight.get(dedup_key)
+                if running is not None:
+                    self._callbacks[running].append(entry)
+                    return True
+                self._inflight[dedup_key] = task._dispatch_key
+                self._dedup_keys[task._dispatch_key] = dedup_key
+            if dedup_key is not None or on_success or on_error or on_progress:
+                self._callbacks[task._dispatch_key] = [entry]
+        return False
+    
+    def _finish(self, key: str) -> list:
+        """任务结束：取出全部回调并解除去重登记"""
+        with self._lock:
+            entries = self._callbacks.pop(key, ())
+            dedup_key = self._dedup_keys.pop(key, None)
+            if dedup_key is not None and self._inflight.get(dedup_key) == key:
+                del self._inflight[dedup_key]
+        return entries
+    
+    def _on_ok(self, key: str, result: Any):
+        # 合并进来的调用方各自拿到结果的深拷贝（在任何回调执行前复制），
+        # 避免一个回调原地修改影响其他回调
+        subscribers = [entry for entry in self._finish(key) if entry[1]]
+        results = [result] + [copy.deepcopy(result) for _ in subscribers[1:]]
+        for (task_id, on_success, _on_error, _on_progress), own_result in zip(subscribers, results):
+            on_success(task_id, own_result)
+    
+    def _on_err(self, key: str, error_msg: str, error: Exception):
+        for task_id, _on_success, on_error, _on_progress in self._finish(key):
+            if on_error:
+                on_error(task_id, error_msg, error)
+    
+    def _on_progress(self, key: str, progress: int, message: str):
+        for task_id, _on_success, _on_error, on_progress in self._callbacks.get(key, ()):
+            if on_progress:
+                on_progress(task_id, progress, message)
+
+
+_dispatcher: Optional[_Dispatcher] = None
+_dispatcher_lock = threading.Lock()
+# 任务ID与分发键计数器（毫秒时间戳在突发提交时会重复）
+_task_counter = itertools.count(1)
+
+
+def _get_dispatcher() -> _Dispatcher:
+    """获取全局分发器；保证其归属GUI线程，使工作线程发出的信号排队到GUI线程处理"""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                dispatcher = _Dispatcher()
+                app = QtCore.QCoreApplication.instance()
+                if app is not None and dispatcher.thread() != app.thread():
+                    dispatcher.moveToThread(app.thread())
+                _dispatcher = dispatcher
+    return _dispatcher
+
+
 class IOTaskBase(QRunnable):
     """IO任务基类
     
@@ -43,28 +191,106 @@ class IOTaskBase(QRunnable):
     
     def __init__(self, task_id: str = None):
         super().__init__()
-        self.task_id = task_id or f"io_task_{int(time.time() * 1000)}"
-        self.signals = WorkerSignals()
+        number = next(_task_counter)
+        self.task_id = task_id or f"io_task_{number}"
+        # 内部分发键：调用方传入的task_id可能重复，回调按此键登记
+        self._dispatch_key = f"io_dispatch_{number}"
+        self.signals = _get_dispatcher()
         self._logger = get_logger()
         
     def run(self):
         """QRunnable接口实现，子类应重写execute方法"""
         try:
             result = self.execute()
-            self.signals.ok.emit(self.task_id, result)
+            self.signals.ok.emit(self._dispatch_key, result)
         except Exception as e:
             error_msg = f"IO任务执行失败: {str(e)}"
             self._logger.error(f"[{self.task_id}] {error_msg}")
             self._logger.debug(f"[{self.task_id}] 异常详情: {traceback.format_exc()}")
-            self.signals.err.emit(self.task_id, error_msg, e)
+            self.signals.err.emit(self._dispatch_key, error_msg, e)
     
     def execute(self) -> Any:
         """子类需要实现的具体执行逻辑"""
         raise NotImplementedError("子类必须实现execute方法")
     
+    def dedup_key(self) -> Optional[tuple]:
+        """在途去重键：键相同的任务同时提交时只执行一次；None表示不去重"""
+        return None
+    
     def emit_progress(self, progress: int, message: str = ""):
         """发射进度信号"""
-        self.signals.progress.emit(self.task_id, progress, message)
+        self.signals.progress.emit(self._dispatch_key, progress, message)
+
+
+# ==================== 按扩展名分发的读写函数 ====================
+
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def _file_ext(file_path: str) -> str:
+    """小写扩展名（os.path.splitext，不构造Path对象）"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _read_json(file_path: str, encoding: str) -> Any:
+    return _json_loads_bytes(_read_file_bytes(file_path), encoding)
+
+
+def _read_image(file_path: str, encoding: str) -> np.ndarray:
+    if file_path.isascii():
+        # ASCII路径直接交给OpenCV读取，省去Python侧缓冲
+        content = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
+    else:
+        # 中文路径cv2.imread无法打开：读入字节后以只读视图交给imdecode，不再额外复制
+        img_data = np.frombuffer(_read_file_bytes(file_path), dtype=np.uint8)
+        content = cv2.imdecode(img_data, cv2.IMREAD_UNCHANGED)
+    if content is None:
+        raise ValueError(f"无法解码图像文件: {file_path}")
+    return content
+
+
+def _read_text(file_path: str, encoding: str) -> str:
+    with open(file_path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+# 扩展名 -> (进度提示, 读取函数)
+_READERS: Dict[str, tuple] = {
+    '.json': ("读取JSON文件", _read_json),
+    **{ext: ("读取图像文件", _read_image) for ext in _IMAGE_EXTENSIONS},
+}
+_DEFAULT_READER = ("读取文本文件", _read_text)
+
+
+def _encode_json(file_path: str, file_ext: str, content: Any, encoding: str) -> bytes:
+    return _json_dumps_bytes(content, encoding)
+
+
+def _encode_image(file_path: str, file_ext: str, content: Any, encoding: str) -> np.ndarray:
+    if not isinstance(content, np.ndarray):
+        raise TypeError("图像文件需要numpy.ndarray类型的内容")
+    # 使用cv2.imencode处理中文路径
+    success, encoded_img = cv2.imencode(file_ext, content)
+    if not success:
+        raise ValueError(f"无法编码图像: {file_path}")
+    # 直接写出编码缓冲区（缓冲区协议，无额外复制）
+    return encoded_img
+
+
+def _encode_text(file_path: str, file_ext: str, content: Any, encoding: str) -> bytes:
+    text = str(content)
+    # 与文本模式open()一致：按平台换行符写出
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode(encoding)
+
+
+# 扩展名 -> (进度提示, 编码函数)
+_WRITERS: Dict[str, tuple] = {
+    '.json': ("写入JSON文件", _encode_json),
+    **{ext: ("写入图像文件", _encode_image) for ext in _IMAGE_EXTENSIONS},
+}
+_DEFAULT_WRITER = ("写入文本文件", _encode_text)
 
 
 class FileReadTask(IOTaskBase):
@@ -75,6 +301,9 @@ class FileReadTask(IOTaskBase):
         self.file_path = file_path
         self.encoding = encoding
     
+    def dedup_key(self) -> Optional[tuple]:
+        return ('FileReadTask', os.path.abspath(self.file_path), self.encoding)
+    
     def execute(self) -> Dict[str, Any]:
         """执行文件读取"""
         self.emit_progress(10, f"开始读取文件: {self.file_path}")
@@ -85,23 +314,10 @@ class FileReadTask(IOTaskBase):
         self.emit_progress(30, "检查文件权限")
         
         # 根据文件扩展名选择读取方式
-        file_ext = Path(self.file_path).suffix.lower()
-        
-        if file_ext == '.json':
-            self.emit_progress(50, "读取JSON文件")
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                content = json.load(f)
-        elif file_ext in ['.png', '.jpg', '.jpeg', '.bmp']:
-            self.emit_progress(50, "读取图像文件")
-            # 使用cv2.imdecode处理中文路径
-            img_data = np.fromfile(self.file_path, dtype=np.uint8)
-            content = cv2.imdecode(img_data, cv2.IMREAD_UNCHANGED)
-            if content is None:
-                raise ValueError(f"无法解码图像文件: {self.file_path}")
-        else:
-            self.emit_progress(50, "读取文本文件")
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                content = f.read()
+        file_ext = _file_ext(self.file_path)
+        label, reader = _READERS.get(file_ext, _DEFAULT_READER)
+        self.emit_progress(50, label)
+        content = reader(self.file_path, self.encoding)
         
         self.emit_progress(100, "文件读取完成")
         
@@ -113,8 +329,95 @@ class FileReadTask(IOTaskBase):
         }
 
 
+# 原子写入临时文件的打开标志：Windows下需二进制模式，避免换行被转换
+_ATOMIC_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_all(fd: int, view: memoryview):
+    """循环写入直到全部写完（os.write可能部分写入）"""
+    written = 0
+    while written < len(view):
+        written += os.write(fd, view[written:])
+
+
+def _atomic_replace(file_path: str, fill: Callable[[int], int]) -> int:
+    """由fill向同目录临时文件写入内容，fsync后用os.replace原子替换目标文件
+
+    写入过程中崩溃或出错时目标文件保持原样；返回fill报告的字节数。
+    """
+    try:
+        mode = os.stat(file_path).st_mode & 0o777  # 保留已有文件的权限
+    except OSError:
+        mode = 0o644
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, _ATOMIC_WRITE_FLAGS, mode)
+    try:
+        try:
+            size = fill(fd)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def _atomic_write(file_path: str, payload) -> int:
+    """把完整内容一次性写入并原子替换目标文件，返回写入的字节数"""
+    view = memoryview(payload).cast('B')
+    
+    def fill(fd: int) -> int:
+        _write_all(fd, view)
+        return len(view)
+    
+    return _atomic_replace(file_path, fill)
+
+
+def _atomic_copy(source: str, file_path: str) -> int:
+    """把source文件复制到file_path（原子替换），返回复制的字节数
+
+    优先使用os.copy_file_range在内核内复制（支持时还可共享数据块），
+    不支持或跨文件系统失败时从当前偏移继续用大块读写完成。
+    """
+    def fill(fd: int) -> int:
+        src_fd = os.open(source, _RAW_READ_FLAGS)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            copied = 0
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while remaining > 0:
+                        count = os.copy_file_range(src_fd, fd, remaining)
+                        if count == 0:
+                            break
+                        copied += count
+                        remaining -= count
+                except OSError:
+                    pass  # 两个文件偏移已同步前进，下面从断点继续
+            while True:
+                chunk = os.read(src_fd, 1 << 20)
+                if not chunk:
+                    break
+                _write_all(fd, memoryview(chunk))
+                copied += len(chunk)
+            return copied
+        finally:
+            os.close(src_fd)
+    
+    return _atomic_replace(file_path, fill)
+
+
 class FileWriteTask(IOTaskBase):
-    """文件写入任务"""
+    """文件写入任务
+    
+    先把内容完整序列化为字节，再一次写入临时文件并原子替换目标文件。
+    content为bytes类对象时原样写出；为Path对象时视为源文件，复制其内容。
+    """
     
     def __init__(self, file_path: str, content: Any, encoding: str = 'utf-8', task_id: str = None):
         super().__init__(task_id)
@@ -126,53 +429,98 @@ class FileWriteTask(IOTaskBase):
         """执行文件写入"""
         self.emit_progress(10, f"开始写入文件: {self.file_path}")
         
-        # 确保目录存在
-        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        # 确保目录存在（相对路径的文件名没有目录部分）
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
         self.emit_progress(30, "创建目录")
         
-        file_ext = Path(self.file_path).suffix.lower()
-        
-        if file_ext == '.json':
-            self.emit_progress(50, "写入JSON文件")
-            with open(self.file_path, 'w', encoding=self.encoding) as f:
-                json.dump(self.content, f, ensure_ascii=False, indent=2)
-        elif file_ext in ['.png', '.jpg', '.jpeg', '.bmp']:
-            self.emit_progress(50, "写入图像文件")
-            if isinstance(self.content, np.ndarray):
-                # 使用cv2.imencode处理中文路径
-                success, encoded_img = cv2.imencode(file_ext, self.content)
-                if success:
-                    encoded_img.tofile(self.file_path)
-                else:
-                    raise ValueError(f"无法编码图像: {self.file_path}")
-            else:
-                raise TypeError("图像文件需要numpy.ndarray类型的内容")
+        file_ext = _file_ext(self.file_path)
+        
+        if isinstance(self.content, PurePath):
+            # 内容为文件路径：在内核内复制，数据不经过Python
+            self.emit_progress(50, f"复制文件: {self.content}")
+            file_size = _atomic_copy(os.fspath(self.content), self.file_path)
+            self.emit_progress(100, "文件写入完成")
+            return {
+                'file_path': self.file_path,
+                'file_size': file_size,
+                'success': True
+            }
+        
+        if isinstance(self.content, (bytes, bytearray, memoryview)):
+            # 已编码的内容（如调用方预先编码好的PNG）原样写出，跳过序列化/编码
+            self.emit_progress(50, "写入二进制内容")
+            payload = self.content
         else:
-            self.emit_progress(50, "写入文本文件")
-            with open(self.file_path, 'w', encoding=self.encoding) as f:
-                f.write(str(self.content))
+            label, encoder = _WRITERS.get(file_ext, _DEFAULT_WRITER)
+            self.emit_progress(50, label)
+            payload = encoder(self.file_path, file_ext, self.content, self.encoding)
+        
+        file_size = _atomic_write(self.file_path, payload)
         
         self.emit_progress(100, "文件写入完成")
         
         return {
             'file_path': self.file_path,
-            'file_size': os.path.getsize(self.file_path),
+            'file_size': file_size,
             'success': True
         }
 
 
+# 共享HTTP会话：所有HTTPRequestTask复用同一个连接池，避免每个请求重新握手TCP/TLS
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """获取共享的requests.Session（首次使用时创建）"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                # 连接池大小与IO线程池规模匹配；只对幂等请求做少量重试
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                      max_retries=Retry(total=2, backoff_factor=0.2))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({'User-Agent': 'AI-IDE-Auto-Run/1.0',
+                                        'Connection': 'keep-alive'})
+                _http_session = session
+    return _http_session
+
+
+def close_http_session():
+    """关闭共享的requests.Session"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
 class HTTPRequestTask(IOTaskBase):
     """HTTP请求任务"""
     
     def __init__(self, url: str, method: str = 'GET', headers: Dict = None, 
-                 data: Any = None, timeout: int = 30, task_id: str = None):
+                 data: Any = None, timeout: int = 30, task_id: str = None,
+                 session: Optional[requests.Session] = None):
         super().__init__(task_id)
         self.url = url
         self.method = method.upper()
         self.headers = headers or {}
         self.data = data
         self.timeout = timeout
+        # 需要隔离会话（如独立Cookie）时可传入自己的session
+        self.session = session
+    
+    def dedup_key(self) -> Optional[tuple]:
+        # 只合并使用共享会话、无请求体的GET请求
+        if self.method != 'GET' or self.data is not None or self.session is not None:
+            return None
+        return ('HTTPRequestTask', self.url, tuple(sorted(self.headers.items())), self.timeout)
     
     def execute(self) -> Dict[str, Any]:
         """执行HTTP请求"""
@@ -184,27 +532,41 @@ class HTTPRequestTask(IOTaskBase):
         
         self.emit_progress(30, "发送HTTP请求")
         
-        response = requests.request(
+        session = self.session or _get_http_session()
+        with session.request(
             method=self.method,
             url=self.url,
             headers=self.headers,
             data=self.data,
-            timeout=self.timeout
-        )
-        
-        self.emit_progress(70, f"收到响应: {response.status_code}")
-        
-        # 检查响应状态
-        response.raise_for_status()
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            self.emit_progress(40, f"收到响应: {response.status_code}")
+            
+            # 检查响应状态（在读取响应体之前）
+            response.raise_for_status()
+            
+            # 流式读取响应体到单个缓冲区，按已接收字节数报告真实下载进度
+            body = self._read_body(response)
         
         self.emit_progress(90, "解析响应内容")
         
+        # 服务器声明了Python不认识的字符集时按未声明处理（与 requests 的 .text/.json 一样退回UTF-8），
+        # 避免 LookupError 让整个任务失败
+        encoding = response.encoding
+        if encoding:
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                encoding = None
+        
         # 尝试解析JSON，失败则返回文本
         try:
-            content = response.json()
+            content = _json_loads_bytes(body, encoding or 'utf-8')
             content_type = 'json'
-        except:
-            content = response.text
+        except ValueError:
+            # JSON解码错误和字符集解码错误都是ValueError子类；取消/中断等异常不应落入文本分支
+            content = self._decode_text(body, encoding)
             content_type = 'text'
         
         self.emit_progress(100, "HTTP请求完成")
@@ -217,33 +579,175 @@ class HTTPRequestTask(IOTaskBase):
             'content_type': content_type,
             'encoding': response.encoding
         }
+    
+    # 流式读取的块大小
+    CHUNK_SIZE = 1 << 16
+    
+    def _read_body(self, response: requests.Response) -> bytearray:
+        """分块读取响应体，进度从40%线性增长到85%"""
+        try:
+            total = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            total = 0
+        body = bytearray()
+        last_percent = 40
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            body.extend(chunk)
+            if total:
+                percent = 40 + min(45, len(body) * 45 // total)
+                if percent > last_percent:
+                    last_percent = percent
+                    self.emit_progress(percent, f"已接收 {len(body)}/{total} 字节")
+        return body
+    
+    @staticmethod
+    def _decode_text(body: bytearray, encoding: Optional[str]) -> str:
+        """按响应声明的字符集解码文本；未声明时先试UTF-8，再按内容探测"""
+        if encoding:
+            return body.decode(encoding, errors='replace')
+        try:
+            return body.decode('utf-8')
+        except UnicodeDecodeError:
+            detected = requests.compat.chardet.detect(bytes(body))['encoding'] or 'utf-8'
+            return body.decode(detected, errors='replace')
+
+
+# 批量读取使用的底层打开标志：只读、不继承句柄，Windows下需二进制模式
+_RAW_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    """以最少的系统调用读取整个文件（open + fstat + read + close）
+
+    绕过Python缓冲文件对象和文本解码层，由调用方在内存中解码。
+    """
+    fd = os.open(file_path, _RAW_READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        parts = [os.read(fd, size) if size else b'']
+        # 少数文件系统会返回短读，或文件在读取期间增长，继续读到EOF
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            parts.append(chunk)
+        return parts[0] if len(parts) == 1 else b''.join(parts)
+    finally:
+        os.close(fd)
+
+
+def _decode_json(file_path: str, data: bytes, encoding: str) -> Any:
+    return _json_loads_bytes(data, encoding)
+
+
+def _decode_image(file_path: str, data: bytes, encoding: str) -> np.ndarray:
+    content = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if content is None:
+        raise ValueError(f"无法解码图像文件: {file_path}")
+    return content
+
+
+def _decode_text(file_path: str, data: bytes, encoding: str) -> str:
+    # 与文本模式open()一致的通用换行转换
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# 扩展名 -> 字节解码函数（批量/内联读取使用）
+_DECODERS: Dict[str, Callable[[str, bytes, str], Any]] = {
+    '.json': _decode_json,
+    **{ext: _decode_image for ext in _IMAGE_EXTENSIONS},
+}
+
+
+def _decode_file_bytes(file_path: str, file_ext: str, data: bytes, encoding: str = 'utf-8') -> Any:
+    """按扩展名解码已读入内存的文件内容，结果与FileReadTask一致"""
+    return _DECODERS.get(file_ext, _decode_text)(file_path, data, encoding)
+
+
+def _prefetch(paths: List[str]):
+    """提示内核预读文件到页缓存（POSIX_FADV_WILLNEED），冷缓存时读取与解析可并行
+
+    不支持posix_fadvise的平台（Windows/macOS）上为空操作；预读失败不影响后续读取。
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, _RAW_READ_FLAGS)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
 
 class BatchFileLoadTask(IOTaskBase):
-    """批量文件加载任务"""
+    """批量文件加载任务
+    
+    按批读取原始字节后统一解码，每个文件只需 open/fstat/read/close，
+    且不再为每个文件创建FileReadTask（及其信号对象）。
+    """
     
-    def __init__(self, file_paths: List[str], task_id: str = None):
+    # 每批文件数：进度信号按批发送
+    BATCH_SIZE = 128
+    # 预读窗口：读取当前文件时提示内核预读其后第N个文件
+    PREFETCH_WINDOW = 16
+    
+    def __init__(self, file_paths: List[str], task_id: str = None, encoding: str = 'utf-8'):
         super().__init__(task_id)
         self.file_paths = file_paths
+        self.encoding = encoding
+        # 每个失败文件对应的异常对象，供批处理分发器回传给原始任务
+        self.errors: Dict[str, Exception] = {}
     
     def execute(self) -> Dict[str, Any]:
         """执行批量文件加载"""
         results = {}
         failed_files = []
         total_files = len(self.file_paths)
+        prefetch = hasattr(os, 'posix_fadvise')
+        if prefetch:
+            _prefetch(self.file_paths[:self.PREFETCH_WINDOW])
         
-        for i, file_path in enumerate(self.file_paths):
-            progress = int((i / total_files) * 100)
-            self.emit_progress(progress, f"加载文件 {i+1}/{total_files}: {os.path.basename(file_path)}")
+        for start in range(0, total_files, self.BATCH_SIZE):
+            batch = self.file_paths[start:start + self.BATCH_SIZE]
+            progress = int((start / total_files) * 100)
+            self.emit_progress(progress, f"加载文件 {start+1}-{start+len(batch)}/{total_files}")
             
-            try:
-                # 创建子任务进行文件读取
-                read_task = FileReadTask(file_path)
-                result = read_task.execute()
-                results[file_path] = result
-            except Exception as e:
-                self._logger.warning(f"加载文件失败: {file_path}, 错误: {e}")
-                failed_files.append({'file_path': file_path, 'error': str(e)})
+            # 先集中读取本批字节，再逐个解码
+            raw: List[Any] = []
+            for i, file_path in enumerate(batch, start):
+                # 滑动窗口：保持后续PREFETCH_WINDOW个文件处于预读中
+                if prefetch and i + self.PREFETCH_WINDOW < total_files:
+                    _prefetch([self.file_paths[i + self.PREFETCH_WINDOW]])
+                try:
+                    raw.append(_read_file_bytes(file_path))
+                except FileNotFoundError:
+                    raw.append(FileNotFoundError(f"文件不存在: {file_path}"))
+                except OSError as e:
+                    raw.append(e)
+            
+            for file_path, data in zip(batch, raw):
+                try:
+                    if isinstance(data, Exception):
+                        raise data
+                    file_ext = _file_ext(file_path)
+                    results[file_path] = {
+                        'file_path': file_path,
+                        'content': _decode_file_bytes(file_path, file_ext, data, self.encoding),
+                        'file_size': len(data),
+                        'file_type': file_ext
+                    }
+                except Exception as e:
+                    self._logger.warning(f"加载文件失败: {file_path}, 错误: {e}")
+                    failed_files.append({'file_path': file_path, 'error': str(e)})
+                    self.errors[file_path] = e
         
         self.emit_progress(100, f"批量加载完成，成功: {len(results)}, 失败: {len(failed_files)}")
         
@@ -265,19 +769,139 @@ def get_global_thread_pool() -> QThreadPool:
     global _global_thread_pool
     if _global_thread_pool is None:
         _global_thread_pool = QThreadPool.globalInstance()
-        # 设置合理的线程数量，避免过多线程竞争
-        max_threads = min(8, (_global_thread_pool.maxThreadCount() // 2) or 4)
-        _global_thread_pool.setMaxThreadCount(max_threads)
-        get_logger().info(f"初始化全局IO线程池，最大线程数: {max_threads}")
+        # 按CPU核心数和任务构成（环境变量IO_CPU_RATIO，默认以IO为主）确定线程数，
+        # IO任务大部分时间在等待，适度超配线程可以提高吞吐
+        optimize_thread_pool(cpu_intensive_ratio=_read_io_cpu_ratio(), gui_priority=True)
+        get_logger().info(f"初始化全局IO线程池，最大线程数: {_global_thread_pool.maxThreadCount()}")
     return _global_thread_pool
 
 
+def _read_io_cpu_ratio() -> float:
+    """读取环境变量IO_CPU_RATIO（CPU密集型任务比例，0~1），无效时使用默认值0.1"""
+    raw = os.environ.get('IO_CPU_RATIO', '0.1')
+    try:
+        return min(1.0, max(0.0, float(raw)))
+    except ValueError:
+        get_logger().warning(f"IO_CPU_RATIO无效: {raw}，使用默认值0.1")
+        return 0.1
+
+
+def _on_gui_thread() -> bool:
+    """当前线程是否为运行Qt事件循环的主线程"""
+    app = QtCore.QCoreApplication.instance()
+    return app is not None and app.thread() == QtCore.QThread.currentThread()
+
+
+def _start_io(task: IOTaskBase) -> str:
+    """把已登记回调的任务直接交给线程池"""
+    thread_pool = get_global_thread_pool()
+    thread_pool.start(task)
+    
+    get_logger().debug(f"提交IO任务: {task.task_id}, 当前活跃线程: {thread_pool.activeThreadCount()}")
+    
+    return task.task_id
+
+
+class _PendingBatcher(QObject):
+    """FileReadTask微批处理器
+    
+    在短时间窗口内收集GUI线程提交的文件读取任务；窗口结束时如果积攒了
+    足够多的任务，就合并成一个BatchFileLoadTask执行，再通过分发器把结果
+    逐个交给原始任务的回调。窗口长度根据线程池繁忙程度自适应调整。
+    """
+    
+    # 合并阈值：超过该数量的读取任务才合并为批任务
+    MERGE_THRESHOLD = 4
+    # 窗口范围（毫秒）
+    MIN_INTERVAL_MS = 1
+    MAX_INTERVAL_MS = 50
+    INITIAL_INTERVAL_MS = 5
+    
+    def __init__(self):
+        super().__init__()
+        self._pending: deque = deque()
+        self._interval_ms = self.INITIAL_INTERVAL_MS
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+    
+    def enqueue(self, task: 'FileReadTask'):
+        """加入待处理队列（回调已在分发器登记），必要时启动合并窗口"""
+        self._pending.append(task)
+        if not self._timer.isActive():
+            self._timer.start(self._interval_ms)
+    
+    def flush(self):
+        """立即提交所有待处理任务"""
+        self._timer.stop()
+        if not self._pending:
+            return
+        pending = list(self._pending)
+        self._pending.clear()
+        
+        if len(pending) > self.MERGE_THRESHOLD:
+            # 不同编码的读取分开成批
+            groups: Dict[str, list] = {}
+            for task in pending:
+                groups.setdefault(task.encoding, []).append(task)
+            for encoding, tasks in groups.items():
+                self._start_batch(encoding, tasks)
+        else:
+            for task in pending:
+                _start_io(task)
+        
+        # 反馈调节：线程池越忙（在途任务相对排队任务越多）窗口越长，合并越充分
+        in_flight = get_global_thread_pool().activeThreadCount()
+        interval = int(in_flight / len(pending) * 10)
+        self._interval_ms = max(self.MIN_INTERVAL_MS, min(self.MAX_INTERVAL_MS, interval))
+    
+    def _start_batch(self, encoding: str, tasks: list):
+        """把一组读取任务合并为BatchFileLoadTask，并以各任务自己的身份分发结果"""
+        batch = BatchFileLoadTask([task.file_path for task in tasks],
+                                  task_id=f"io_batch_{tasks[0].task_id}", encoding=encoding)
+        dispatcher = batch.signals
+        
+        def on_batch_done(_batch_id: str, result: Dict[str, Any]):
+            successful = result['successful_files']
+            for task in tasks:
+                file_result = successful.get(task.file_path)
+                if file_result is not None:
+                    dispatcher.ok.emit(task._dispatch_key, file_result)
+                else:
+                    error = batch.errors.get(task.file_path) or IOError(f"读取失败: {task.file_path}")
+                    dispatcher.err.emit(task._dispatch_key, f"IO任务执行失败: {str(error)}", error)
+        
+        def on_batch_error(_batch_id: str, error_msg: str, error: Exception):
+            for task in tasks:
+                dispatcher.err.emit(task._dispatch_key, error_msg, error)
+        
+        get_logger().debug(f"合并 {len(tasks)} 个文件读取任务为批任务: {batch.task_id}")
+        dispatcher.register(batch, on_batch_done, on_batch_error)
+        _start_io(batch)
+
+
+_pending_batcher: Optional[_PendingBatcher] = None
+
+
+def _get_pending_batcher() -> _PendingBatcher:
+    """获取微批处理器（仅在GUI线程上创建和使用）"""
+    global _pending_batcher
+    if _pending_batcher is None:
+        _pending_batcher = _PendingBatcher()
+    return _pending_batcher
+
+
 def submit_io(task: IOTaskBase, 
               on_success: Callable[[str, Any], None] = None,
               on_error: Callable[[str, str, Exception], None] = None,
               on_progress: Callable[[str, int, str], None] = None) -> str:
     """提交IO任务到线程池
     
+    与正在执行的任务去重键相同（如同一文件的读取、同一URL的GET）时不再重复执行，
+    回调挂到在途任务上，收到同一个结果对象。
+    GUI线程上提交的无进度回调的FileReadTask会进入短暂的合并窗口，
+    突发的大量读取会合并为一个BatchFileLoadTask执行；其他任务直接启动。
+    
     Args:
         task: IO任务实例
         on_success: 成功回调函数 (task_id, result)
@@ -287,30 +911,68 @@ def submit_io(task: IOTaskBase,
     Returns:
         str: 任务ID
     """
-    thread_pool = get_global_thread_pool()
+    if task.signals.register(task, on_success, on_error, on_progress):
+        get_logger().debug(f"IO任务 {task.task_id} 与在途任务相同，复用其结果")
+        return task.task_id
     
-    # 连接信号
-    if on_success:
-        task.signals.ok.connect(on_success)
-    if on_error:
-        task.signals.err.connect(on_error)
-    if on_progress:
-        task.signals.progress.connect(on_progress)
+    if type(task) is FileReadTask and on_progress is None and _on_gui_thread():
+        _get_pending_batcher().enqueue(task)
+        return task.task_id
     
-    # 提交任务
-    thread_pool.start(task)
-    
-    get_logger().debug(f"提交IO任务: {task.task_id}, 当前活跃线程: {thread_pool.activeThreadCount()}")
+    return _start_io(task)
+
+
+# 小于该大小的文件在GUI线程内联读取，省去QRunnable调度与跨线程信号开销
+_INLINE_READ_THRESHOLD = 64 * 1024
+
+
+def _read_small_file_inline(file_path: str, encoding: str, task_id: Optional[str],
+                            on_success: Callable[[str, Any], None] = None,
+                            on_error: Callable[[str, str, Exception], None] = None) -> str:
+    """内联读取小文件，并通过QTimer.singleShot(0)异步投递回调以保持异步语义"""
+    task_id = task_id or f"io_task_{next(_task_counter)}"
+    file_ext = _file_ext(file_path)
+    try:
+        data = _read_file_bytes(file_path)
+        result = {
+            'file_path': file_path,
+            'content': _decode_file_bytes(file_path, file_ext, data, encoding),
+            'file_size': len(data),
+            'file_type': file_ext
+        }
+    except Exception as e:
+        # except块结束时e会被删除，先绑定到局部变量供延迟回调使用
+        error = FileNotFoundError(f"文件不存在: {file_path}") if isinstance(e, FileNotFoundError) else e
+        error_msg = f"IO任务执行失败: {str(error)}"
+        get_logger().error(f"[{task_id}] {error_msg}")
+        if on_error:
+            QTimer.singleShot(0, lambda: on_error(task_id, error_msg, error))
+        return task_id
     
-    return task.task_id
+    if on_success:
+        QTimer.singleShot(0, lambda: on_success(task_id, result))
+    return task_id
 
 
 def submit_file_read(file_path: str,
                      on_success: Callable[[str, Any], None] = None,
                      on_error: Callable[[str, str, Exception], None] = None,
                      encoding: str = 'utf-8',
-                     task_id: str = None) -> str:
-    """便捷函数：提交文件读取任务"""
+                     task_id: str = None,
+                     force_async: bool = False) -> str:
+    """便捷函数：提交文件读取任务
+    
+    小文件（<64KiB）在GUI线程上直接读取，回调仍在下一轮事件循环触发；
+    需要始终走线程池时传入force_async=True。
+    """
+    if not force_async and _on_gui_thread():
+        try:
+            small = os.stat(file_path).st_size < _INLINE_READ_THRESHOLD
+        except OSError:
+            small = False
+        if small:
+            return _read_small_file_inline(file_path, encoding, task_id, on_success, on_error)
+    
     task = FileReadTask(file_path, encoding, task_id)
     return submit_io(task, on_success, on_error)
 
@@ -325,12 +987,36 @@ def submit_file_write(file_path: str, content: Any,
     return submit_io(task, on_success, on_error)
 
 
+async def _async_http_request_checked(url: str, method: str, headers: Dict,
+                                      data: Any, timeout: int) -> Dict[str, Any]:
+    """在后台事件循环上执行HTTP请求，错误状态码与HTTPRequestTask一样抛出HTTPError"""
+    from workers.async_tasks import async_http_request
+    
+    result = await async_http_request(url, method.upper(), headers, data, timeout)
+    if result['status_code'] >= 400:
+        raise requests.HTTPError(f"{result['status_code']} Error for url: {url}")
+    result['headers'] = dict(result['headers'])
+    return result
+
+
 def submit_http_request(url: str, method: str = 'GET',
                         on_success: Callable[[str, Any], None] = None,
                         on_error: Callable[[str, str, Exception], None] = None,
                         headers: Dict = None, data: Any = None,
-                        timeout: int = 30, task_id: str = None) -> str:
-    """便捷函数：提交HTTP请求任务"""
+                        timeout: int = 30, task_id: str = None,
+                        use_async: bool = False) -> str:
+    """便捷函数：提交HTTP请求任务
+    
+    use_async=True时不占用线程池线程，而是把请求交给async_tasks的后台事件循环，
+    所有请求在一个线程上复用共享的aiohttp连接池，适合大量并发请求；
+    结果格式同async_http_request，回调仍在GUI线程触发。
+    """
+    if use_async:
+        from workers.async_tasks import submit_background_async
+        
+        coro = _async_http_request_checked(url, method, headers, data, timeout)
+        return submit_background_async(coro, on_success, on_error, task_id)
+    
     task = HTTPRequestTask(url, method, headers, data, timeout, task_id)
     return submit_io(task, on_success, on_error)
 
@@ -416,8 +1102,24 @@ class WebSocketTask(IOTaskBase):
         return result
 
 
+# 配置读取缓存：绝对路径 -> (st_mtime_ns, st_size, 内容)
+# JSON配置缓存原始字节、每次读取重新解析，调用方各自得到独立的对象；文本配置缓存不可变的str
+_config_cache: Dict[str, tuple] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _invalidate_config_cache(config_path: Path):
+    """写入/更新配置后使对应的缓存失效"""
+    with _config_cache_lock:
+        _config_cache.pop(os.path.abspath(config_path), None)
+
+
 class ConfigurationTask(IOTaskBase):
-    """配置文件操作任务"""
+    """配置文件操作任务
+    
+    read操作按 (路径, mtime_ns, 文件大小) 缓存文件内容，文件未变化时不再读盘；
+    JSON在命中缓存时重新解析，返回的config_data可由调用方自由修改。
+    """
 
     def __init__(self, config_path: str, operation: str = 'read',
                  config_data: Dict = None, task_id: str = None):
@@ -433,21 +1135,36 @@ class ConfigurationTask(IOTaskBase):
         if self.operation == 'read':
             self.emit_progress(30, f"读取配置文件: {config_path.name}")
 
-            if not config_path.exists():
-                raise FileNotFoundError(f"配置文件不存在: {config_path}")
+            try:
+                stat = config_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"配置文件不存在: {config_path}") from None
 
-            with open(config_path, 'r', encoding='utf-8') as f:
+            cache_key = os.path.abspath(config_path)
+            with _config_cache_lock:
+                cached = _config_cache.get(cache_key)
+            cache_hit = cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+
+            if cache_hit:
+                content = cached[2]
+            else:
                 if config_path.suffix.lower() == '.json':
-                    config_data = json.load(f)
+                    content = _read_file_bytes(str(config_path))
                 else:
-                    config_data = f.read()
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                with _config_cache_lock:
+                    _config_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, content)
+
+            config_data = _json_loads_bytes(content) if isinstance(content, bytes) else content
 
             self.emit_progress(100, "配置读取完成")
             return {
                 'operation': 'read',
                 'config_path': str(config_path),
                 'config_data': config_data,
-                'file_size': config_path.stat().st_size
+                'file_size': stat.st_size,
+                'cached': cache_hit
             }
 
         elif self.operation == 'write':
@@ -456,12 +1173,14 @@ class ConfigurationTask(IOTaskBase):
             # 确保目录存在
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                if config_path.suffix.lower() == '.json':
-                    json.dump(self.config_data, f, indent=2, ensure_ascii=False)
-                else:
+            if config_path.suffix.lower() == '.json':
+                with open(config_path, 'wb') as f:
+                    f.write(_json_dumps_bytes(self.config_data))
+            else:
+                with open(config_path, 'w', encoding='utf-8') as f:
                     f.write(str(self.config_data))
 
+            _invalidate_config_cache(config_path)
             self.emit_progress(100, "配置写入完成")
             return {
                 'operation': 'write',
@@ -474,10 +1193,8 @@ class ConfigurationTask(IOTaskBase):
 
             # 先读取现有配置
             existing_config = {}
-            if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    if config_path.suffix.lower() == '.json':
-                        existing_config = json.load(f)
+            if config_path.exists() and config_path.suffix.lower() == '.json':
+                existing_config = _json_loads_bytes(_read_file_bytes(str(config_path)))
 
             self.emit_progress(60, "合并配置数据")
 
@@ -490,12 +1207,14 @@ class ConfigurationTask(IOTaskBase):
 
             # 写入更新后的配置
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                if config_path.suffix.lower() == '.json':
-                    json.dump(merged_config, f, indent=2, ensure_ascii=False)
-                else:
+            if config_path.suffix.lower() == '.json':
+                with open(config_path, 'wb') as f:
+                    f.write(_json_dumps_bytes(merged_config))
+            else:
+                with open(config_path, 'w', encoding='utf-8') as f:
                     f.write(str(merged_config))
 
+            _invalidate_config_cache(config_path)
             self.emit_progress(100, "配置更新完成")
             return {
                 'operation': 'update',
@@ -508,6 +1227,110 @@ class ConfigurationTask(IOTaskBase):
             raise ValueError(f"不支持的操作类型: {self.operation}")
 
 
+def _keyword_offsets(low: np.ndarray, keyword: bytes) -> np.ndarray:
+    """在已转小写的字节数组中查找关键字的所有起始偏移
+
+    先用首字节筛出候选位置，再逐字节收窄，避免对整个缓冲区做多次比较。
+    """
+    span = low.size - len(keyword) + 1
+    if span <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.flatnonzero(low[:span] == keyword[0])
+    for i in range(1, len(keyword)):
+        candidates = candidates[low[candidates + i] == keyword[i]]
+    return candidates
+
+
+def _unique_sorted(values: np.ndarray) -> np.ndarray:
+    """对已排序数组去重（线性时间，不再排序）"""
+    if values.size == 0:
+        return values
+    keep = np.empty(values.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(pattern, flags: int = 0) -> re.Pattern:
+    """编译并缓存正则表达式（str或bytes模式），重复的查询直接复用"""
+    return re.compile(pattern, flags)
+
+
+# 字节正则与str正则语义不同的构造：\w/\d/\s/\b 等字符类在 bytes 下只认ASCII，
+# 字符组与单个 "." 按字节而非字符计数，遇到多字节的中文会漏掉整行（".*"、".+" 不受影响）
+_BYTES_UNSAFE_PATTERN = re.compile(r'\\[wWdDsSbB]|\[|\.(?![*+])')
+
+
+@functools.lru_cache(maxsize=8)
+def _hyperscan_database(keywords: tuple):
+    """编译并缓存忽略大小写的Hyperscan关键字数据库"""
+    database = hyperscan.Database()
+    database.compile(expressions=list(keywords), ids=list(range(len(keywords))),
+                     elements=len(keywords), flags=[hyperscan.HS_FLAG_CASELESS] * len(keywords))
+    return database
+
+
+def _hyperscan_keyword_offsets(chunk: bytes, keywords: tuple) -> List[np.ndarray]:
+    """用Hyperscan单次扫描找出所有关键字的起始偏移，按keywords顺序返回
+
+    Hyperscan报告的是匹配结束位置，减去关键字长度得到起点。
+    """
+    database = _hyperscan_database(keywords)
+    hits: List[List[int]] = [[] for _ in keywords]
+
+    def on_match(keyword_id, _start, end, _flags, _context):
+        hits[keyword_id].append(end - len(keywords[keyword_id]))
+
+    database.scan(chunk, match_event_handler=on_match)
+    return [np.asarray(offsets, dtype=np.intp) for offsets in hits]
+
+
+def _count_severity_lines(buf: np.ndarray) -> Tuple[int, int]:
+    """单次遍历字节缓冲区，统计含error/fatal的行数和（不含错误关键字而）含warn的行数
+
+    关键字与LogAnalysisTask._SEVERITY_KEYWORDS一致，字母或0x20后比较以忽略ASCII大小写。
+    纯Python执行很慢，仅作为Numba编译的源函数使用。
+    """
+    errors = 0
+    warnings = 0
+    line_error = False
+    line_warning = False
+    size = buf.size
+    for i in range(size):
+        c = buf[i]
+        if c == 10:
+            if line_error:
+                errors += 1
+            elif line_warning:
+                warnings += 1
+            line_error = False
+            line_warning = False
+            continue
+        if line_error:
+            continue
+        c |= 32
+        if c == 101 and i + 4 < size:  # error
+            if ((buf[i + 1] | 32) == 114 and (buf[i + 2] | 32) == 114
+                    and (buf[i + 3] | 32) == 111 and (buf[i + 4] | 32) == 114):
+                line_error = True
+        elif c == 102 and i + 4 < size:  # fatal
+            if ((buf[i + 1] | 32) == 97 and (buf[i + 2] | 32) == 116
+                    and (buf[i + 3] | 32) == 97 and (buf[i + 4] | 32) == 108):
+                line_error = True
+        elif c == 119 and not line_warning and i + 3 < size:  # warn
+            if (buf[i + 1] | 32) == 97 and (buf[i + 2] | 32) == 114 and (buf[i + 3] | 32) == 110:
+                line_warning = True
+    if line_error:
+        errors += 1
+    elif line_warning:
+        warnings += 1
+    return errors, warnings
+
+
+_count_severity_lines_jit = numba.njit(cache=True)(_count_severity_lines) if NUMBA_AVAILABLE else None
+
+
 class LogAnalysisTask(IOTaskBase):
     """日志分析任务"""
 
@@ -518,48 +1341,58 @@ class LogAnalysisTask(IOTaskBase):
         self.pattern = pattern
         self.max_lines = max_lines
 
+    # 严重级别关键字（小写，匹配时忽略ASCII大小写），前两个计为错误，其余计为警告
+    _SEVERITY_KEYWORDS = (b'error', b'fatal', b'warn')
+    _ERROR_KEYWORD_COUNT = 2
+    # 换行与关键字扫描的分块大小，限制小写副本和布尔掩码的内存占用
+    _SCAN_CHUNK_SIZE = 8 << 20
+    # 最多返回的匹配行数
+    MAX_MATCHED_LINES = 100
+
     def execute(self) -> Dict[str, Any]:
-        """执行日志分析"""
-        import re
+        """执行日志分析
 
+        通过mmap直接在字节上扫描，不再逐行解码和分配字符串：换行位置和
+        严重级别关键字都由NumPy向量化查找，只有模式命中的行才会被解码。
+        """
         log_path = Path(self.log_path)
         if not log_path.exists():
             raise FileNotFoundError(f"日志文件不存在: {log_path}")
 
         self.emit_progress(10, f"开始分析日志: {log_path.name}")
 
+        file_size = log_path.stat().st_size
         total_lines = 0
         matched_lines = []
         error_count = 0
         warning_count = 0
 
-        pattern_regex = re.compile(self.pattern) if self.pattern else None
-
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                if line_num > self.max_lines:
-                    break
-
-                total_lines += 1
-                line = line.strip()
-
-                # 统计错误和警告
-                if 'ERROR' in line.upper() or 'FATAL' in line.upper():
-                    error_count += 1
-                elif 'WARNING' in line.upper() or 'WARN' in line.upper():
-                    warning_count += 1
-
-                # 模式匹配
-                if pattern_regex and pattern_regex.search(line):
-                    matched_lines.append({
-                        'line_number': line_num,
-                        'content': line
-                    })
-
-                # 更新进度
-                if line_num % 1000 == 0:
-                    progress = min(90, int((line_num / self.max_lines) * 90))
-                    self.emit_progress(progress, f"已分析 {line_num} 行")
+        pattern_regex = _compile(self.pattern) if self.pattern else None
+
+        if file_size > 0 and self.max_lines > 0:
+            with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                arr = np.frombuffer(mm, dtype=np.uint8)
+                try:
+                    # 换行位置用于确定max_lines截断点、总行数和行号
+                    newlines, end, total_lines = self._find_line_breaks(arr)
+
+                    self.emit_progress(40, f"统计错误和警告 ({total_lines} 行)")
+                    counts = None
+                    if NUMBA_AVAILABLE and not HYPERSCAN_AVAILABLE:
+                        counts = self._count_severity_jit(arr[:end])
+                    if counts is not None:
+                        error_count, warning_count = counts
+                    else:
+                        error_lines, warning_lines = self._scan_severity(arr[:end], newlines)
+                        error_count = int(error_lines.size)
+                        # 同时含错误关键字的行只计为错误
+                        warning_count = int(np.setdiff1d(warning_lines, error_lines, assume_unique=True).size)
+                finally:
+                    del arr  # 释放对mmap缓冲区的引用，否则无法关闭mmap
+
+                if pattern_regex:
+                    self.emit_progress(70, "模式匹配")
+                    matched_lines = self._match_lines(mm, end, newlines, pattern_regex)
 
         self.emit_progress(100, "日志分析完成")
 
@@ -568,11 +1401,115 @@ class LogAnalysisTask(IOTaskBase):
             'total_lines': total_lines,
             'error_count': error_count,
             'warning_count': warning_count,
-            'matched_lines': matched_lines[:100],  # 最多返回100个匹配行
+            'matched_lines': matched_lines,
             'pattern': self.pattern,
-            'file_size': log_path.stat().st_size
+            'file_size': file_size
         }
 
+    def _find_line_breaks(self, buf: np.ndarray) -> Tuple[np.ndarray, int, int]:
+        """分块查找换行位置，找到max_lines个换行即停止，返回 (换行位置, 截断点, 总行数)
+
+        只读取前max_lines行所在的页面，大日志文件的其余部分不会被换入内存。
+        """
+        parts = []
+        found = 0
+        for start in range(0, buf.size, self._SCAN_CHUNK_SIZE):
+            offsets = np.flatnonzero(buf[start:start + self._SCAN_CHUNK_SIZE] == 0x0A)
+            parts.append(offsets + start)
+            found += offsets.size
+            if found >= self.max_lines:
+                break
+        newlines = np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+        if newlines.size >= self.max_lines:
+            newlines = newlines[:self.max_lines]
+            return newlines, int(newlines[-1]) + 1, self.max_lines
+        return newlines, buf.size, newlines.size + (0 if buf[-1] == 0x0A else 1)
+
+    def _count_severity_jit(self, buf: np.ndarray) -> Optional[Tuple[int, int]]:
+        """用Numba编译的单次遍历统计错误/警告行数；编译或执行失败时返回None并停用"""
+        global NUMBA_AVAILABLE
+        try:
+            errors, warnings = _count_severity_lines_jit(buf)
+            return int(errors), int(warnings)
+        except Exception as e:
+            self._logger.warning(f"Numba扫描失败，改用NumPy扫描: {e}")
+            NUMBA_AVAILABLE = False
+            return None
+
+    def _scan_severity(self, buf: np.ndarray, newlines: np.ndarray):
+        """分块扫描关键字，返回含错误/警告关键字的行索引（升序去重）"""
+        global HYPERSCAN_AVAILABLE
+        keywords = self._SEVERITY_KEYWORDS
+        overlap = max(len(k) for k in keywords) - 1
+        error_parts = []
+        warning_parts = []
+        for start in range(0, buf.size, self._SCAN_CHUNK_SIZE):
+            stop = min(buf.size, start + self._SCAN_CHUNK_SIZE)
+            chunk = buf[start:min(buf.size, stop + overlap)]
+            limit = stop - start
+            found = None
+            if HYPERSCAN_AVAILABLE:
+                try:
+                    found = _hyperscan_keyword_offsets(chunk.tobytes(), keywords)
+                except Exception as e:
+                    self._logger.warning(f"Hyperscan扫描失败，改用NumPy扫描: {e}")
+                    HYPERSCAN_AVAILABLE = False
+            if found is None:
+                # ASCII字母或0x20后即为小写，用于忽略大小写比较
+                low = chunk | 0x20
+                found = [_keyword_offsets(low, keyword) for keyword in keywords]
+                del low
+            for i, offsets in enumerate(found):
+                parts = error_parts if i < self._ERROR_KEYWORD_COUNT else warning_parts
+                parts.append(offsets[offsets < limit] + start)
+
+        def to_lines(parts):
+            offsets = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+            return _unique_sorted(np.searchsorted(newlines, offsets))
+
+        return to_lines(error_parts), to_lines(warning_parts)
+
+    def _match_lines(self, mm: mmap.mmap, end: int, newlines: np.ndarray,
+                     pattern_regex) -> List[Dict[str, Any]]:
+        """在字节缓冲区上查找模式命中的行，只解码命中行"""
+        matched_lines = []
+        # 行首/行尾锚点依赖去除空白后的行，非ASCII模式无法编码为ASCII字节正则，
+        # 字符类、字符组和单个 "." 在字节上匹配不到非ASCII字符（见 _BYTES_UNSAFE_PATTERN），
+        # 这些情况无法用字节正则预筛选，退回逐行解码匹配
+        if (not self.pattern.isascii()
+                or any(token in self.pattern for token in ('^', '$', '\\A', '\\Z'))
+                or _BYTES_UNSAFE_PATTERN.search(self.pattern)):
+            text = mm[:end].decode('utf-8', errors='ignore')
+            for line_num, line in enumerate(text.split('\n'), 1):
+                line = line.strip()
+                if pattern_regex.search(line):
+                    matched_lines.append({'line_number': line_num, 'content': line})
+                    if len(matched_lines) >= self.MAX_MATCHED_LINES:
+                        break
+            return matched_lines
+
+        pattern_bytes = _compile(self.pattern.encode('ascii'), re.IGNORECASE | re.MULTILINE)
+        last_line = -1
+
+        for match in pattern_bytes.finditer(mm, 0, end):
+            # 通过换行位置表二分得到行号和行边界，无需回扫缓冲区
+            line_index = int(np.searchsorted(newlines, match.start()))
+            if line_index == last_line:
+                continue
+            last_line = line_index
+            line_num = line_index + 1
+            line_start = int(newlines[line_index - 1]) + 1 if line_index else 0
+            line_end = int(newlines[line_index]) if line_index < newlines.size else end
+
+            line = mm[line_start:line_end].decode('utf-8', errors='ignore').strip()
+            # 字节正则忽略大小写，只做预筛选；最终以区分大小写的原始字符串正则为准
+            if pattern_regex.search(line):
+                matched_lines.append({'line_number': line_num, 'content': line})
+                if len(matched_lines) >= self.MAX_MATCHED_LINES:
+                    break
+
+        return matched_lines
+
 
 # ==================== 扩展的便捷函数 ====================
 
@@ -631,8 +1568,8 @@ def optimize_thread_pool(cpu_intensive_ratio: float = 0.3, gui_priority: bool =
     if gui_priority:
         # GUI优先模式：保守的线程配置
         if cpu_intensive_ratio < 0.2:
-            # 主要是IO任务，但为GUI保留资源
-            optimal_threads = min(cpu_count * 2, 12)
+            # 主要是IO任务，但为GUI保留资源；IO线程多在等待，少核机器上也至少保留4个
+            optimal_threads = max(4, min(cpu_count * 2, 12))
         elif cpu_intensive_ratio > 0.7:
             # 主要是CPU任务，最保守
             optimal_threads = max(2, min(cpu_count, 4))
@@ -652,6 +1589,9 @@ def optimize_thread_pool(cpu_intensive_ratio: float = 0.3, gui_priority: bool =
     pool.setMaxThreadCount(optimal_threads)
     # 缩短超时时间，快速释放空闲线程
     pool.setExpiryTimeout(15000)  # 15秒超时，减少资源占用
+    if gui_priority and hasattr(pool, 'setThreadPriority'):
+        # 工作线程使用低优先级，避免与GUI线程争抢CPU（Qt 6.2+）
+        pool.setThreadPriority(QtCore.QThread.Priority.LowPriority)
 
     get_logger().info(f"线程池已优化，最大线程数: {optimal_threads} (CPU核心数: {cpu_count}, GUI优先: {gui_priority})")
 
@@ -666,6 +1606,8 @@ def optimize_thread_pool(cpu_intensive_ratio: float = 0.3, gui_priority: bool =
 def cleanup_thread_pool():
     """清理线程池资源"""
     global _global_thread_pool
+    if _pending_batcher is not None:
+        _pending_batcher.flush()
     if _global_thread_pool:
         _global_thread_pool.waitForDone(5000)  # 等待5秒
         active_count = _global_thread_pool.activeThreadCount()
@@ -673,6 +1615,7 @@ def cleanup_thread_pool():
             get_logger().warning(f"线程池清理时仍有 {active_count} 个活跃线程")
         _global_thread_pool = None
         get_logger().info("线程池已清理")
+    close_http_session()
 
 
 def get_detailed_thread_pool_stats() -> Dict[str, Any]: